@@ -25,86 +25,414 @@
 """
 
 import ast
+import asyncio
+import collections
 import concurrent.futures
+import contextlib
+import hashlib
+import heapq
+import importlib
+import io
 import json
+import mmap
+import os
+import re
+import sqlite3
+import subprocess
+import threading
+import tokenize
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Dict, List, Optional, Set, Type, Union
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, AsyncIterator, Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
+
+# Batches per worker when splitting files for the process backend; more
+# batches balance uneven file sizes, fewer cut pickling overhead
+BATCHES_PER_WORKER = 4
+
+# Files per process batch when streaming, where the file count is unknown
+STREAM_CHUNK_SIZE = 32
+
+# Fresh results written to the cache per transaction
+CACHE_WRITE_BATCH = 256
+
+# Files larger than this are skipped; generated code rarely repays parsing
+DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024
+
+# Files from this size on are memory-mapped instead of read
+MMAP_THRESHOLD = 1024 * 1024
+
+# Leading bytes checked for NUL bytes to detect binary files
+BINARY_SNIFF_SIZE = 8192
+
+# Bump whenever metric definitions change, invalidating cached results
+ANALYZER_VERSION = "4"
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "code_analyzer" / "metrics.sqlite"
 
 @dataclass
 class CodeMetrics:
     """Code metrics container."""
     lines_of_code: int = 0
     comment_lines: int = 0
+    blank_lines: int = 0
+    docstring_lines: int = 0
     function_count: int = 0
     class_count: int = 0
     complexity: int = 0
     dependencies: Set[str] = field(default_factory=set)
     nested_depth: int = 0
+    imports: List[Tuple[str, int, Tuple[str, ...]]] = field(default_factory=list)
     
     def to_dict(self) -> dict:
         """Convert metrics to dictionary."""
         return {
             "lines_of_code": self.lines_of_code,
             "comment_lines": self.comment_lines,
+            "blank_lines": self.blank_lines,
+            "docstring_lines": self.docstring_lines,
             "function_count": self.function_count,
             "class_count": self.class_count,
             "complexity": self.complexity,
             "dependencies": list(self.dependencies),
             "nested_depth": self.nested_depth
         }
+    
+    def pack(self) -> Tuple:
+        """Convert metrics to a compact tuple for sending between processes."""
+        return (
+            self.lines_of_code,
+            self.comment_lines,
+            self.blank_lines,
+            self.docstring_lines,
+            self.function_count,
+            self.class_count,
+            self.complexity,
+            tuple(self.dependencies),
+            self.nested_depth,
+            tuple(self.imports)
+        )
+    
+    @classmethod
+    def unpack(cls, packed: Tuple) -> "CodeMetrics":
+        """Rebuild metrics from a tuple created by pack(), or its JSON form."""
+        *counts, dependencies, depth, imports = packed
+        imports = [(module, level, tuple(names)) for module, level, names in imports]
+        return cls(*counts, set(dependencies), depth, imports)
 
-class MetricsVisitor(ast.NodeVisitor):
-    """AST visitor for collecting metrics."""
+def _import_numpy() -> Any:
+    """Import NumPy, which only the NPZ export needs."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("NumPy export requires numpy (pip install numpy)") from e
+    return numpy
+
+class MetricsTable:
+    """Columnar store of per-file metrics.
+    
+    Each metric is an ``array`` column indexed by file, and dependencies are
+    interned to integer IDs stored in one flat column with per-file offsets
+    (CSR layout). A repository's metrics then take a handful of compact
+    buffers instead of a dataclass, set and strings per file, and
+    aggregations run over whole columns.
+    """
+    
+    __slots__ = (
+        "paths", "lines_of_code", "comment_lines", "blank_lines", "docstring_lines",
+        "function_count", "class_count",
+        "complexity", "nested_depth", "dependency_names", "dependency_ids",
+        "dependency_offsets", "_dependency_index"
+    )
+    
+    COLUMNS = (
+        "lines_of_code", "comment_lines", "blank_lines", "docstring_lines",
+        "function_count", "class_count", "complexity", "nested_depth"
+    )
     
     def __init__(self):
-        self.metrics = CodeMetrics()
-        self.current_depth = 0
+        self.paths: List[str] = []
+        for column in self.COLUMNS:
+            setattr(self, column, array("q"))
+        self.dependency_names: List[str] = []
+        self.dependency_ids = array("q")
+        self.dependency_offsets = array("q", [0])
+        self._dependency_index: Dict[str, int] = {}
+    
+    @classmethod
+    def from_results(cls, results: Iterable[Tuple[str, CodeMetrics]]) -> "MetricsTable":
+        """Build a table from (path, metrics) pairs, e.g. a streaming iterator."""
+        table = cls()
+        for path, metrics in results:
+            table.append(path, metrics)
+        return table
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def append(self, path: str, metrics: CodeMetrics) -> None:
+        """Add one file's metrics."""
+        self.paths.append(path)
+        for column in self.COLUMNS:
+            getattr(self, column).append(getattr(metrics, column))
+        for name in metrics.dependencies:
+            dependency_id = self._dependency_index.get(name)
+            if dependency_id is None:
+                dependency_id = self._dependency_index[name] = len(self.dependency_names)
+                self.dependency_names.append(name)
+            self.dependency_ids.append(dependency_id)
+        self.dependency_offsets.append(len(self.dependency_ids))
+    
+    def dependencies(self, index: int) -> Set[str]:
+        """Get the dependencies of the file at index."""
+        start, end = self.dependency_offsets[index], self.dependency_offsets[index + 1]
+        return {self.dependency_names[i] for i in self.dependency_ids[start:end]}
+    
+    def row(self, index: int) -> CodeMetrics:
+        """Rebuild the CodeMetrics of the file at index (without imports)."""
+        values = {column: getattr(self, column)[index] for column in self.COLUMNS}
+        return CodeMetrics(dependencies=self.dependencies(index), **values)
     
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Visit class definition."""
-        self.metrics.class_count += 1
-        self.generic_visit(node)
+    def totals(self) -> Dict[str, int]:
+        """Sum every metric over the repository."""
+        totals = {column: sum(getattr(self, column)) for column in self.COLUMNS}
+        totals["files"] = len(self)
+        totals["unique_dependencies"] = len(self.dependency_names)
+        return totals
     
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Visit function definition."""
+    def percentiles(self, column: str, percents: Iterable[float] = (50, 90, 99)) -> Dict[float, int]:
+        """Get nearest-rank percentiles of a metric."""
+        values = sorted(getattr(self, column))
+        if not values:
+            return {percent: 0 for percent in percents}
+        return {
+            percent: values[int(max(1, -(-len(values) * percent // 100))) - 1]
+            for percent in percents
+        }
+    
+    def top(self, column: str = "complexity", n: int = 10) -> List[Tuple[str, int]]:
+        """Get the n files with the highest value of a metric."""
+        values = getattr(self, column)
+        indices = heapq.nlargest(n, range(len(values)), key=values.__getitem__)
+        return [(self.paths[i], values[i]) for i in indices]
+    
+    def dependency_counts(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Count how many files import each dependency, most common first."""
+        counts = collections.Counter(self.dependency_ids).most_common(n)
+        return [(self.dependency_names[i], count) for i, count in counts]
+    
+    def to_numpy(self) -> Dict[str, Any]:
+        """Convert the columns to NumPy arrays without copying metric data."""
+        np = _import_numpy()
+        
+        arrays = {column: np.frombuffer(getattr(self, column), dtype=np.int64) for column in self.COLUMNS}
+        arrays.update(
+            paths=np.array(self.paths, dtype=str),
+            dependency_names=np.array(self.dependency_names, dtype=str),
+            dependency_ids=np.array(self.dependency_ids, dtype=np.int64),
+            dependency_offsets=np.frombuffer(self.dependency_offsets, dtype=np.int64),
+        )
+        return arrays
+    
+    def save_npz(self, path: Union[str, Path]) -> Path:
+        """Save the table as a compressed NumPy archive."""
+        np = _import_numpy()
+        np.savez_compressed(path, **self.to_numpy())
+        return Path(path)
+    
+    @classmethod
+    def load_npz(cls, path: Union[str, Path]) -> "MetricsTable":
+        """Load a table saved with save_npz()."""
+        np = _import_numpy()
+        table = cls()
+        with np.load(path) as data:
+            table.paths = data["paths"].tolist()
+            for column in cls.COLUMNS:
+                setattr(table, column, array("q", data[column].tolist()))
+            table.dependency_names = data["dependency_names"].tolist()
+            table.dependency_ids = array("q", data["dependency_ids"].tolist())
+            table.dependency_offsets = array("q", data["dependency_offsets"].tolist())
+        table._dependency_index = {name: i for i, name in enumerate(table.dependency_names)}
+        return table
+    
+    def save_parquet(self, path: Union[str, Path]) -> Path:
+        """Save the table as Parquet, one row per file."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet export requires pyarrow (pip install pyarrow)") from e
+        
+        # Parquet dictionary-encodes the repeated dependency names
+        names = pa.array(self.dependency_names, type=pa.string())
+        dependencies = pa.ListArray.from_arrays(
+            pa.array(self.dependency_offsets, type=pa.int32()),
+            names.take(pa.array(self.dependency_ids, type=pa.int32()))
+        )
+        columns = {"path": pa.array(self.paths, type=pa.string())}
+        columns.update((column, pa.array(getattr(self, column), type=pa.int64())) for column in self.COLUMNS)
+        columns["dependencies"] = dependencies
+        pq.write_table(pa.table(columns), str(path))
+        return Path(path)
+
+# Node types that open a function scope or add a decision point
+_FUNCTION_NODES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+_BRANCH_NODES = frozenset(
+    node_type
+    for node_type in (
+        ast.If, ast.IfExp, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler,
+        # match statements only exist on Python 3.10+
+        getattr(ast, "match_case", None),
+    )
+    if node_type is not None
+)
+
+class MetricsVisitor:
+    """Single-pass AST traversal for collecting metrics.
+    
+    Walks the tree once with an explicit stack, so the cost is linear in
+    the number of nodes however deeply functions are nested. Each decision
+    point counts once, towards the innermost enclosing function.
+    """
+    
+    def __init__(self):
+        self.metrics = CodeMetrics()
+    
+    def visit(self, tree: ast.AST) -> None:
+        """Collect metrics for a tree."""
         # @probe:complexity 🧮 How would you measure complexity?
         # - What factors indicate complexity?
         # - How would you weight different factors?
         # - What other metrics would help?
         
-        self.metrics.function_count += 1
-        
-        # Calculate complexity (simplified)
-        complexity = 1  # Base complexity
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-        
-        self.metrics.complexity += complexity
-        self.generic_visit(node)
-    
-    def visit_Import(self, node: ast.Import) -> None:
-        """Visit import statement."""
-        for name in node.names:
-            self.metrics.dependencies.add(name.name)
-        self.generic_visit(node)
-    
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        """Visit from-import statement."""
-        if node.module:
-            self.metrics.dependencies.add(node.module)
-        self.generic_visit(node)
-    
-    def generic_visit(self, node: ast.AST) -> None:
-        """Visit a node."""
-        self.current_depth += 1
-        self.metrics.nested_depth = max(self.metrics.nested_depth, self.current_depth)
-        super().generic_visit(node)
-        self.current_depth -= 1
+        metrics = self.metrics
+        dependencies = metrics.dependencies
+        imports = metrics.imports
+        iter_child_nodes = ast.iter_child_nodes
+        functions = classes = complexity = 0
+        max_depth = metrics.nested_depth
+        
+        # (node, depth, inside a function)
+        stack = [(tree, 1, False)]
+        while stack:
+            node, depth, in_function = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            
+            node_type = type(node)
+            if node_type in _FUNCTION_NODES:
+                functions += 1
+                complexity += 1  # Base complexity
+                in_function = True
+            elif node_type is ast.ClassDef:
+                classes += 1
+            elif node_type is ast.Import:
+                dependencies.update(name.name for name in node.names)
+                imports.extend((name.name, 0, ()) for name in node.names)
+            elif node_type is ast.ImportFrom:
+                if node.module:
+                    dependencies.add(node.module)
+                imports.append((node.module or "", node.level, tuple(name.name for name in node.names)))
+            elif in_function:
+                # try/except* handlers are ExceptHandler nodes as well
+                if node_type in _BRANCH_NODES:
+                    complexity += 1
+                elif node_type is ast.BoolOp:
+                    complexity += len(node.values) - 1
+                elif node_type is ast.comprehension:
+                    complexity += 1 + len(node.ifs)
+            
+            depth += 1
+            stack.extend((child, depth, in_function) for child in iter_child_nodes(node))
+        
+        metrics.function_count += functions
+        metrics.class_count += classes
+        metrics.complexity += complexity
+        metrics.nested_depth = max_depth
+
+# Tokens after which a new logical line starts
+_LINE_START_TOKENS = frozenset({tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT, tokenize.ENCODING})
+
+def count_lines(tokens: Iterable[tokenize.TokenInfo]) -> Tuple[int, int, int, int]:
+    """Count physical, comment, blank and docstring lines in one pass over the tokens.
+    
+    Lines with an inline comment count as comment lines. Docstring lines
+    are those of string literals standing alone as a statement, which
+    covers module, class, function and attribute docstrings.
+    
+    Args:
+        tokens: Token stream, from ``tokenize.tokenize`` (bytes) or
+            ``tokenize.generate_tokens`` (str)
+    
+    Returns:
+        (physical lines, comment lines, blank lines, docstring lines)
+    """
+    comments = blanks = docstrings = 0
+    line_start = True
+    docstring_start = docstring_end = 0
+    last_row = 1
+    
+    for token_type, _, start, end, line in tokens:
+        if token_type == tokenize.COMMENT:
+            comments += 1
+            continue
+        if token_type == tokenize.NL:
+            blanks += not line.strip()
+            continue
+        
+        if token_type == tokenize.STRING and (line_start or docstring_start):
+            # Adjacent literals are implicitly concatenated into one string
+            docstring_start = docstring_start or start[0]
+            docstring_end = end[0]
+        elif token_type == tokenize.NEWLINE and docstring_start:
+            docstrings += docstring_end - docstring_start + 1
+            docstring_start = 0
+        elif token_type == tokenize.ENDMARKER:
+            # The end marker sits on the line after the last one
+            last_row = start[0]
+        else:
+            docstring_start = 0
+        line_start = token_type in _LINE_START_TOKENS
+    
+    return last_row - 1, comments, blanks, docstrings
+
+class SourceSkipped(Exception):
+    """Raised when a file is deliberately not analyzed."""
+
+@contextlib.contextmanager
+def read_source(path: Union[str, Path], max_size: Optional[int] = DEFAULT_MAX_FILE_SIZE) -> Iterator[Any]:
+    """Open a source file as raw bytes, leaving decoding to the analyzer.
+    
+    Files of MMAP_THRESHOLD bytes or more are memory-mapped instead of
+    read. Either way the result is a bytes-like object that ``ast.parse``
+    and ``tokenize`` accept directly, so PEP 263 encoding cookies and BOMs
+    are honoured.
+    
+    Args:
+        path: Source file
+        max_size: Size cap in bytes (None for no cap)
+    
+    Raises:
+        SourceSkipped: If the file is too large or looks binary
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if max_size is not None and size > max_size:
+            raise SourceSkipped(f"larger than {max_size} bytes")
+        
+        if size < MMAP_THRESHOLD:
+            data = f.read()
+            if b"\0" in data[:BINARY_SNIFF_SIZE]:
+                raise SourceSkipped("binary file")
+            yield data
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data.find(b"\0", 0, BINARY_SNIFF_SIZE) != -1:
+                raise SourceSkipped("binary file")
+            yield data
 
 class BaseAnalyzer(ABC):
     """Base class for code analyzers."""
@@ -113,102 +441,1065 @@ class BaseAnalyzer(ABC):
     def analyze(self, content: str) -> CodeMetrics:
         """Analyze code content."""
         pass
+    
+    def analyze_bytes(self, data: Any) -> CodeMetrics:
+        """Analyze raw file content (bytes or a memory map).
+        
+        Decodes as UTF-8 by default; analyzers for languages with their
+        own encoding rules override this.
+        """
+        return self.analyze(bytes(data).decode("utf-8-sig", errors="replace"))
 
 class PythonAnalyzer(BaseAnalyzer):
     """Python code analyzer."""
     
     def analyze(self, content: str) -> CodeMetrics:
         """Analyze Python code."""
-        tree = ast.parse(content)
+        return self._analyze(content, tokenize.generate_tokens(io.StringIO(content).readline))
+    
+    def analyze_bytes(self, data: Any) -> CodeMetrics:
+        """Analyze undecoded Python source, honouring PEP 263 encoding cookies."""
+        readline = data.readline if isinstance(data, mmap.mmap) else io.BytesIO(data).readline
+        return self._analyze(data, tokenize.tokenize(readline))
+    
+    def _analyze(self, source: Any, tokens: Iterable[tokenize.TokenInfo]) -> CodeMetrics:
+        """Collect metrics from the AST and the token stream of one source."""
+        tree = ast.parse(source)
         visitor = MetricsVisitor()
         visitor.visit(tree)
         
         # Count lines
-        lines = content.splitlines()
-        visitor.metrics.lines_of_code = len(lines)
-        visitor.metrics.comment_lines = sum(
-            1 for line in lines
-            if line.strip().startswith("#")
-        )
+        metrics = visitor.metrics
+        (
+            metrics.lines_of_code, metrics.comment_lines,
+            metrics.blank_lines, metrics.docstring_lines
+        ) = count_lines(tokens)
         
-        return visitor.metrics
+        return metrics
+
+class CFamilyAnalyzer(BaseAnalyzer):
+    """Tokenizer-based analyzer for brace-delimited languages.
+    
+    A single regular expression splits the source into comments, strings,
+    words and the few operators that matter, which is enough for counts,
+    complexity and imports without a full parser. Subclasses set the
+    language's keywords.
+    """
+    
+    FUNCTION_KEYWORDS: FrozenSet[str] = frozenset()
+    CLASS_KEYWORDS: FrozenSet[str] = frozenset({"class"})
+    BRANCH_KEYWORDS: FrozenSet[str] = frozenset({"if", "for", "while", "case", "catch"})
+    IMPORT_KEYWORDS: FrozenSet[str] = frozenset({"import"})
+    # Keywords opening an import/export clause, and the keywords that name
+    # the clause's source module (JavaScript's "import x from 'y'")
+    CLAUSE_KEYWORDS: FrozenSet[str] = frozenset()
+    FROM_KEYWORDS: FrozenSet[str] = frozenset()
+    # Words after which a slash starts a regular expression literal rather
+    # than a division; None for languages without regex literals
+    REGEX_PREFIX_WORDS: Optional[FrozenSet[str]] = None
+    
+    _TOKEN_PATTERN = r"""
+        (?P<comment>//[^\n]*|/\*.*?\*/)
+        | (?P<regex>/(?![/*])(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\[\n])+/[A-Za-z]*)
+        | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)
+        | (?P<word>[A-Za-z_$][\w$]*)
+        | (?P<op>&&|\|\||\?\?|\?\.|=>|[{}()?;])
+        """
+    _TOKEN = re.compile(_TOKEN_PATTERN, re.DOTALL | re.VERBOSE)
+    _BRANCH_OPS = frozenset({"&&", "||", "??", "?"})
+    _WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$")
+    
+    def _is_division(self, content: str, start: int) -> bool:
+        """Whether the slash at start divides, judged by the code before it."""
+        if self.REGEX_PREFIX_WORDS is None:
+            return True
+        end = start
+        while end and content[end - 1] in " \t\r\n":
+            end -= 1
+        if not end:
+            return False
+        if content[end - 1] in ")]":
+            return True
+        if content[end - 1] not in self._WORD_CHARS:
+            return False
+        begin = end - 1
+        while begin and content[begin - 1] in self._WORD_CHARS:
+            begin -= 1
+        return content[begin:end] not in self.REGEX_PREFIX_WORDS
+    
+    def analyze(self, content: str) -> CodeMetrics:
+        """Analyze source code."""
+        metrics = CodeMetrics()
+        comment_rows: Set[int] = set()
+        row, position = 1, 0
+        depth = 0
+        importing = in_import_block = clause = False
+        
+        search = self._TOKEN.search
+        match = search(content)
+        while match:
+            kind, text = match.lastgroup, match.group()
+            if kind == "regex" and self._is_division(content, match.start()):
+                # Not a regex literal: skip the slash and tokenize what follows
+                match = search(content, match.start() + 1)
+                continue
+            row += content.count("\n", position, match.start())
+            position = match.start()
+            match = search(content, match.end())
+            
+            if kind == "comment":
+                comment_rows.update(range(row, row + text.count("\n") + 1))
+            elif kind == "string":
+                if importing or in_import_block:
+                    metrics.dependencies.add(text[1:-1])
+                    importing = clause = False
+            elif kind == "word":
+                if text in self.CLAUSE_KEYWORDS:
+                    clause = True
+                if text in self.BRANCH_KEYWORDS:
+                    metrics.complexity += 1
+                elif text in self.FUNCTION_KEYWORDS:
+                    metrics.function_count += 1
+                    metrics.complexity += 1
+                elif text in self.CLASS_KEYWORDS:
+                    metrics.class_count += 1
+                elif text in self.IMPORT_KEYWORDS:
+                    importing = True
+                elif (text in self.FROM_KEYWORDS and clause and content[position - 1:position] != "."
+                        and match is not None and match.lastgroup == "string"):
+                    # match is already the next token: the module name
+                    importing = True
+            elif text == "{":
+                depth += 1
+                metrics.nested_depth = max(metrics.nested_depth, depth)
+            elif text == "}":
+                depth = max(0, depth - 1)
+            elif text == "(":
+                # import ( ... ) blocks and require("...") calls
+                in_import_block = importing
+                clause = False
+            elif text == ")":
+                in_import_block = importing = False
+            elif text == ";":
+                importing = clause = False
+            elif text in self._BRANCH_OPS:
+                metrics.complexity += 1
+            elif text == "=>":
+                metrics.function_count += 1
+                metrics.complexity += 1
+        
+        metrics.lines_of_code = content.count("\n") + (not content.endswith("\n") and bool(content))
+        metrics.comment_lines = len(comment_rows)
+        if content:
+            metrics.blank_lines = sum(1 for line in content.split("\n") if not line.strip()) - content.endswith("\n")
+        return metrics
+
+class JavaScriptAnalyzer(CFamilyAnalyzer):
+    """JavaScript and TypeScript analyzer."""
+    
+    FUNCTION_KEYWORDS = frozenset({"function"})
+    CLASS_KEYWORDS = frozenset({"class", "interface"})
+    IMPORT_KEYWORDS = frozenset({"import", "require"})
+    CLAUSE_KEYWORDS = frozenset({"import", "export"})
+    FROM_KEYWORDS = frozenset({"from"})
+    REGEX_PREFIX_WORDS = frozenset({
+        "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+        "throw", "case", "do", "else", "yield", "await",
+    })
+
+class GoAnalyzer(CFamilyAnalyzer):
+    """Go analyzer."""
+    
+    FUNCTION_KEYWORDS = frozenset({"func"})
+    CLASS_KEYWORDS = frozenset({"struct", "interface"})
+    BRANCH_KEYWORDS = frozenset({"if", "for", "case"})
 
 class AnalyzerFactory:
-    """Factory for creating appropriate analyzer."""
+    """Registry of analyzers by file suffix.
+    
+    Besides the built-in analyzers, analyzers are discovered from the
+    ``code_analyzer.analyzers`` entry point group, named by file suffix
+    (e.g. ``.rs = my_plugin.rust:RustAnalyzer``). Entry points are only
+    scanned when a suffix has no built-in analyzer, and only the analyzers
+    actually used are imported.
+    
+    Each process keeps one instance per analyzer class, reused for every
+    file and shared between threads, so analyzers must not keep per-file
+    state between analyze() calls.
+    """
     
-    _analyzers: Dict[str, Type[BaseAnalyzer]] = {
-        ".py": PythonAnalyzer
+    ENTRY_POINT_GROUP = "code_analyzer.analyzers"
+    
+    # Analyzer classes, "module:attribute" references or entry points
+    _analyzers: Dict[str, Any] = {
+        ".py": PythonAnalyzer,
+        ".js": JavaScriptAnalyzer,
+        ".jsx": JavaScriptAnalyzer,
+        ".mjs": JavaScriptAnalyzer,
+        ".cjs": JavaScriptAnalyzer,
+        ".ts": JavaScriptAnalyzer,
+        ".tsx": JavaScriptAnalyzer,
+        ".go": GoAnalyzer,
     }
+    _instances: Dict[str, Optional[BaseAnalyzer]] = {}
+    _entry_points_loaded = False
+    _lock = threading.Lock()
+    
+    @classmethod
+    def register(cls, suffix: str, analyzer: Union[Type[BaseAnalyzer], str]) -> None:
+        """Register an analyzer class, or a lazy "module:Class" reference, for a suffix.
+        
+        Registrations only affect the current process; process-backend
+        workers started with spawn see entry points, not runtime calls.
+        """
+        with cls._lock:
+            cls._analyzers[suffix] = analyzer
+            cls._instances.pop(suffix, None)
     
     @classmethod
     def get_analyzer(cls, file_path: Union[str, Path]) -> Optional[BaseAnalyzer]:
         """Get appropriate analyzer for file type."""
-        suffix = Path(file_path).suffix
-        analyzer_class = cls._analyzers.get(suffix)
-        return analyzer_class() if analyzer_class else None
+        suffix = os.path.splitext(file_path)[1]
+        try:
+            return cls._instances[suffix]
+        except KeyError:
+            pass
+        
+        with cls._lock:
+            if suffix not in cls._instances:
+                cls._instances[suffix] = cls._load(suffix)
+            return cls._instances[suffix]
+    
+    @classmethod
+    def supports(cls, file_path: Union[str, Path]) -> bool:
+        """Check whether an analyzer is available for a file."""
+        return cls.get_analyzer(file_path) is not None
+    
+    @classmethod
+    def _load(cls, suffix: str) -> Optional[BaseAnalyzer]:
+        """Import and instantiate the analyzer for a suffix."""
+        if suffix not in cls._analyzers and not cls._entry_points_loaded:
+            cls._discover()
+        analyzer = cls._analyzers.get(suffix)
+        if analyzer is None:
+            return None
+        
+        if isinstance(analyzer, str):
+            module_name, _, attribute = analyzer.partition(":")
+            analyzer = getattr(importlib.import_module(module_name), attribute)
+        elif not isinstance(analyzer, type):
+            analyzer = analyzer.load()  # Entry point
+        
+        # Suffixes handled by the same class share one instance
+        for instance in cls._instances.values():
+            if type(instance) is analyzer:
+                return instance
+        return analyzer()
+    
+    @classmethod
+    def _discover(cls) -> None:
+        """Collect (but do not load) entry point analyzers."""
+        cls._entry_points_loaded = True
+        from importlib.metadata import entry_points
+        
+        found = entry_points()
+        if hasattr(found, "select"):
+            group = found.select(group=cls.ENTRY_POINT_GROUP)
+        else:  # Python < 3.10
+            group = found.get(cls.ENTRY_POINT_GROUP, [])
+        for entry_point in group:
+            cls._analyzers.setdefault(entry_point.name, entry_point)
+
+def git_blob_hash(data: bytes) -> str:
+    """Hash content the way git names blobs."""
+    digest = hashlib.sha1(b"blob %d\0" % len(data))
+    digest.update(data)
+    return digest.hexdigest()
+
+def _git(repo: Union[str, Path], *args: str) -> bytes:
+    """Run a git command in repo and return its output.
+    
+    Raises:
+        ValueError: If git fails, e.g. repo is not a repository
+    """
+    try:
+        return subprocess.run(
+            ["git", "-C", str(repo), *args], capture_output=True, check=True
+        ).stdout
+    except FileNotFoundError as e:
+        raise ValueError("git is not installed") from e
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"git {args[0]} failed: {e.stderr.decode(errors='replace').strip()}") from e
+
+@dataclass
+class ChangeSet:
+    """Metrics of a git change set, merged with cached metrics of the rest."""
+    changed: Dict[str, CodeMetrics] = field(default_factory=dict)
+    unchanged: Dict[str, CodeMetrics] = field(default_factory=dict)
+    deleted: List[str] = field(default_factory=list)
+    
+    @property
+    def results(self) -> Dict[str, CodeMetrics]:
+        """Metrics of every known file, fresh ones taking precedence."""
+        return {**self.unchanged, **self.changed}
+
+class MetricsCache:
+    """On-disk cache of file metrics, stored in SQLite.
+    
+    Entries are keyed by absolute path and tagged with the file's size,
+    mtime_ns and content hash plus the analyzer version. A matching size
+    and mtime is trusted without reading the file; otherwise the worker
+    that reads the file hashes it and skips parsing if the hash still
+    matches, so touched-but-unchanged files are not re-parsed. The hash is
+    git's blob ID, so entries can also be matched against a git index
+    without reading any files.
+    """
+    
+    def __init__(self, path: Union[str, Path], version: str = ANALYZER_VERSION):
+        self.path = Path(path)
+        self.version = version
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Streaming consumers may resume the analysis from another thread
+        self.connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute(
+            """CREATE TABLE IF NOT EXISTS metrics (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                version TEXT NOT NULL,
+                metrics TEXT NOT NULL
+            )"""
+        )
+    
+    def __enter__(self) -> "MetricsCache":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Commit pending updates and close the database connection."""
+        self.connection.commit()
+        self.connection.close()
+    
+    def get(self, file: Union[str, Path]) -> Tuple[Optional[CodeMetrics], Optional[Tuple]]:
+        """Look up a file's cached metrics by size and mtime, without reading it.
+        
+        Returns:
+            Cached metrics, or None and the cache key (absolute path, size,
+            mtime_ns, stored hash or None). Both are None if the file
+            cannot be stat'ed.
+        """
+        path = os.path.abspath(file)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None, None
+        row = self.connection.execute(
+            "SELECT size, mtime_ns, hash, metrics FROM metrics WHERE path = ? AND version = ?",
+            (path, self.version)
+        ).fetchone()
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return CodeMetrics.unpack(json.loads(row[3])), None
+        return None, (path, stat.st_size, stat.st_mtime_ns, row[2] if row else None)
+    
+    def revalidate(self, key: Tuple) -> Optional[CodeMetrics]:
+        """Reuse an entry whose file was touched but whose content hash still matches.
+        
+        Args:
+            key: Cache key from get()
+        
+        Returns:
+            The cached metrics, now tagged with the file's new size and mtime
+        """
+        path, size, mtime_ns, _ = key
+        row = self.connection.execute(
+            "SELECT metrics FROM metrics WHERE path = ? AND version = ?", (path, self.version)
+        ).fetchone()
+        if row is None:
+            return None
+        self.connection.execute(
+            "UPDATE metrics SET size = ?, mtime_ns = ? WHERE path = ?", (size, mtime_ns, path)
+        )
+        return CodeMetrics.unpack(json.loads(row[0]))
+    
+    def get_by_hash(self, digests: Dict[str, str]) -> Dict[str, CodeMetrics]:
+        """Look up cached metrics by content hash, without touching the files.
+        
+        Args:
+            digests: Git blob IDs by absolute path
+        
+        Returns:
+            Cached metrics of the paths whose stored hash matches
+        """
+        results = {}
+        for path, digest, metrics in self.connection.execute(
+            "SELECT path, hash, metrics FROM metrics WHERE version = ?", (self.version,)
+        ):
+            if digests.get(path) == digest:
+                results[path] = CodeMetrics.unpack(json.loads(metrics))
+        return results
+    
+    def store(self, entries: List[Tuple[Tuple, str, CodeMetrics]]) -> None:
+        """Cache freshly analyzed metrics.
+        
+        Args:
+            entries: (cache key from get(), content hash, metrics) triples
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO metrics (path, size, mtime_ns, hash, version, metrics) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (*key[:3], digest, self.version, json.dumps(metrics.pack()))
+                    for key, digest, metrics in entries
+                ]
+            )
+
+# An import statement as recorded by MetricsVisitor: (module, level, names).
+# level counts the leading dots of a relative import; names are the names
+# of a from-import and empty for a plain import.
+ImportRecord = Tuple[str, int, Tuple[str, ...]]
+
+class ImportGraph:
+    """Repository-wide import graph between analyzed files.
+    
+    Imports are resolved to files under the root, including relative
+    imports, and kept as forward and reverse adjacency sets keyed by path.
+    Unresolvable imports (the standard library, third-party packages) are
+    left out. The graph is built from CodeMetrics, so cached results can
+    rebuild or update it without parsing anything.
+    """
+    
+    def __init__(self, root: Union[str, Path]):
+        self.root = os.path.abspath(root)
+        self.modules: Dict[str, str] = {}  # Module name -> path
+        self.paths: Dict[str, str] = {}  # Path -> module name
+        self.imports: Dict[str, List[ImportRecord]] = {}
+        self.forward: Dict[str, Set[str]] = {}
+        self.reverse: Dict[str, Set[str]] = collections.defaultdict(set)
+        # Files by each module name (and parent package) they import, for
+        # re-resolving them when a matching module is added or removed
+        self._wanted: Dict[str, Set[str]] = collections.defaultdict(set)
+    
+    @classmethod
+    def from_results(cls, root: Union[str, Path], results: Iterable[Tuple[str, CodeMetrics]]) -> "ImportGraph":
+        """Build a graph from (path, metrics) pairs."""
+        graph = cls(root)
+        for path, metrics in results:
+            graph._add_module(path, metrics.imports)
+        for path in graph.paths:
+            graph._link(path)
+        return graph
+    
+    def module_name(self, path: str) -> Optional[str]:
+        """Get the dotted module name of a file under the root."""
+        relative = os.path.relpath(os.path.abspath(path), self.root)
+        if relative.startswith(os.pardir) or not relative.endswith(".py"):
+            return None
+        parts = relative[:-3].split(os.sep)
+        if parts[-1] == "__init__":
+            parts.pop()
+        return ".".join(parts) or None
+    
+    def update(self, path: str, metrics: CodeMetrics) -> None:
+        """Add a file, or replace its imports after it changed."""
+        if path in self.paths:
+            self._unlink(path)
+            self.imports[path] = list(metrics.imports)
+            self._link(path)
+            return
+        if not self._add_module(path, metrics.imports):
+            return
+        self._link(path)
+        self._relink(self._wanted.get(self.paths[path], ()))
+    
+    def remove(self, path: str) -> None:
+        """Remove a deleted file from the graph."""
+        if path not in self.paths:
+            return
+        self._unlink(path)
+        for importer in list(self.reverse.pop(path, ())):
+            self.forward[importer].discard(path)
+        module = self.paths.pop(path)
+        del self.modules[module]
+        del self.imports[path]
+        del self.forward[path]
+        self._relink(self._wanted.get(module, ()))
+    
+    def dependencies(self, path: str, transitive: bool = False) -> Set[str]:
+        """Get the files a file imports, optionally transitively."""
+        return self._reachable(path, self.forward) if transitive else set(self.forward.get(path, ()))
+    
+    def dependents(self, path: str, transitive: bool = False) -> Set[str]:
+        """Get the files importing a file, optionally transitively."""
+        return self._reachable(path, self.reverse) if transitive else set(self.reverse.get(path, ()))
+    
+    def impact(self, paths: Iterable[str]) -> Set[str]:
+        """Get every file affected by changes to paths: the changed files
+        plus everything that transitively imports them."""
+        impacted = set()
+        for path in paths:
+            if path not in impacted:
+                impacted.add(path)
+                impacted |= self._reachable(path, self.reverse, impacted)
+        return impacted
+    
+    def cycles(self) -> List[List[str]]:
+        """Find import cycles as strongly connected components (Tarjan).
+        
+        Returns:
+            Groups of files that import each other, largest first
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components = []
+        
+        for start in self.forward:
+            if start in index:
+                continue
+            # Iterative DFS; each frame is a node and its unvisited successors
+            index[start] = lowlink[start] = len(index)
+            stack.append(start)
+            on_stack.add(start)
+            frames = [(start, iter(self.forward[start]))]
+            while frames:
+                node, successors = frames[-1]
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = lowlink[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        frames.append((successor, iter(self.forward[successor])))
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[successor])
+                else:
+                    frames.pop()
+                    if frames:
+                        parent = frames[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1:
+                            components.append(sorted(component))
+        
+        return sorted(components, key=len, reverse=True)
+    
+    def _add_module(self, path: str, imports: List[ImportRecord]) -> bool:
+        """Register a file's module name and imports, without linking."""
+        module = self.module_name(path)
+        if module is None:
+            return False
+        self.modules[module] = path
+        self.paths[path] = module
+        self.imports[path] = list(imports)
+        self.forward[path] = set()
+        return True
+    
+    def _link(self, path: str) -> None:
+        """Resolve a file's imports and add its edges."""
+        for target in self._targets(path):
+            for wanted in self._prefixes(target):
+                self._wanted[wanted].add(path)
+            resolved = self._resolve(target)
+            if resolved and resolved != path:
+                self.forward[path].add(resolved)
+                self.reverse[resolved].add(path)
+    
+    def _unlink(self, path: str) -> None:
+        """Remove a file's outgoing edges."""
+        for target in self._targets(path):
+            for wanted in self._prefixes(target):
+                importers = self._wanted.get(wanted)
+                if importers:
+                    importers.discard(path)
+        for dependency in self.forward[path]:
+            self.reverse[dependency].discard(path)
+        self.forward[path] = set()
+    
+    def _relink(self, paths: Iterable[str]) -> None:
+        """Re-resolve files whose imports may now point elsewhere."""
+        for path in list(paths):
+            if path in self.paths:
+                self._unlink(path)
+                self._link(path)
+    
+    def _targets(self, path: str) -> Set[str]:
+        """Get the absolute module names a file's imports ask for."""
+        module = self.paths[path]
+        is_package = os.path.basename(path) == "__init__.py"
+        package = module if is_package else module.rpartition(".")[0]
+        targets = set()
+        
+        for name, level, names in self.imports[path]:
+            if level:
+                # from .x import y: strip one package per extra leading dot
+                parts = package.split(".") if package else []
+                if level - 1 > len(parts):
+                    continue
+                base = ".".join(parts[:len(parts) - (level - 1)])
+                name = ".".join(part for part in (base, name) if part)
+            if name:
+                targets.add(name)
+            # from package import submodule
+            prefix = f"{name}." if name else ""
+            targets.update(prefix + imported for imported in names if imported != "*")
+        return targets
+    
+    def _resolve(self, target: str) -> Optional[str]:
+        """Resolve a module name to a file, falling back to its packages."""
+        for name in self._prefixes(target):
+            path = self.modules.get(name)
+            if path:
+                return path
+        return None
+    
+    @staticmethod
+    def _prefixes(target: str) -> Iterator[str]:
+        """Yield a module name and its parent packages, innermost first."""
+        while target:
+            yield target
+            target = target.rpartition(".")[0]
+    
+    @staticmethod
+    def _reachable(start: str, edges: Dict[str, Set[str]], seen: Optional[Set[str]] = None) -> Set[str]:
+        """Breadth-first search, excluding start unless it is on a cycle."""
+        seen = set() if seen is None else seen
+        found = set()
+        queue = collections.deque([start])
+        while queue:
+            for neighbour in edges.get(queue.popleft(), ()):
+                if neighbour not in found and neighbour not in seen:
+                    found.add(neighbour)
+                    queue.append(neighbour)
+        return found
+
+def _find_files(directory: Path, pattern: Optional[str]) -> Iterator[Path]:
+    """Lazily list files matching pattern, or with an analyzer if pattern is None."""
+    if pattern is not None:
+        return directory.glob(pattern)
+    return (
+        file for file in directory.rglob("*")
+        if AnalyzerFactory.supports(file) and file.is_file()
+    )
+
+def _analyze_batch(
+    items: List[Tuple[str, Optional[str]]],
+    max_file_size: Optional[int],
+    hashed: bool
+) -> List[Tuple[str, Optional[Tuple], Optional[str]]]:
+    """Analyze a batch of (path, cached hash) items in a worker process.
+    
+    Returns:
+        (path, packed metrics or None, content hash or None) for each file
+    """
+    analyzer = CodeAnalyzer(max_file_size=max_file_size)
+    results = []
+    for path, known_hash in items:
+        metrics, digest = analyzer._analyze_file(path, hashed, known_hash)
+        results.append((path, metrics.pack() if metrics else None, digest))
+    return results
 
 class CodeAnalyzer:
     """Main code analyzer class."""
     
-    def __init__(self, max_workers: int = None):
+    BACKENDS = ("thread", "process")
+    
+    def __init__(
+        self,
+        max_workers: int = None,
+        backend: str = "thread",
+        chunk_size: int = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        max_file_size: Optional[int] = DEFAULT_MAX_FILE_SIZE
+    ):
+        """Initialize the analyzer.
+        
+        Args:
+            max_workers: Number of worker threads or processes
+            backend: "thread", or "process" to parse files on all CPU
+                cores instead of sharing the GIL
+            chunk_size: Files per process batch (default: split files into
+                BATCHES_PER_WORKER batches per worker)
+            cache_path: SQLite file caching metrics between runs, so only
+                changed files are parsed again (default: no cache)
+            max_file_size: Skip files larger than this many bytes (None for
+                no limit)
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {', '.join(self.BACKENDS)})")
         self.max_workers = max_workers
+        self.backend = backend
+        self.chunk_size = chunk_size
+        self.cache_path = cache_path
+        self.max_file_size = max_file_size
     
     def analyze_file(self, file_path: Union[str, Path]) -> Optional[CodeMetrics]:
         """Analyze a single file."""
-        file_path = Path(file_path)
-        if not file_path.exists():
-            print(f"File not found: {file_path}")
-            return None
+        return self._analyze_file(file_path)[0]
+    
+    def _analyze_file(
+        self,
+        file_path: Union[str, Path],
+        hashed: bool = False,
+        known_hash: Optional[str] = None
+    ) -> Tuple[Optional[CodeMetrics], Optional[str]]:
+        """Analyze a file, optionally hashing the bytes read for the cache.
         
+        Args:
+            file_path: File to analyze
+            hashed: Also compute the file's git blob ID
+            known_hash: Cached blob ID; if the content still matches, the
+                file is not parsed and no metrics are returned
+        
+        Returns:
+            Tuple of (metrics or None, blob ID or None)
+        """
         analyzer = AnalyzerFactory.get_analyzer(file_path)
         if not analyzer:
             print(f"No analyzer available for: {file_path}")
-            return None
+            return None, None
         
         try:
-            content = file_path.read_text()
-            return analyzer.analyze(content)
+            with read_source(file_path, self.max_file_size) as data:
+                digest = git_blob_hash(data) if hashed else None
+                if digest is not None and digest == known_hash:
+                    return None, digest
+                return analyzer.analyze_bytes(data), digest
+        except FileNotFoundError:
+            print(f"File not found: {file_path}")
+        except SourceSkipped as e:
+            print(f"Skipping {file_path}: {e}")
         except Exception as e:
             print(f"Error analyzing {file_path}: {e}")
-            return None
+        return None, None
     
-    def analyze_directory(self, directory: Union[str, Path], pattern: str = "**/*.py") -> Dict[str, CodeMetrics]:
-        """Analyze all matching files in directory."""
+    def analyze_directory(self, directory: Union[str, Path], pattern: Optional[str] = "**/*.py") -> Dict[str, CodeMetrics]:
+        """Analyze all matching files in directory.
+        
+        A pattern of None selects every file that has a registered analyzer,
+        analyzing a polyglot repository in one pass.
+        """
         directory = Path(directory)
         if not directory.is_dir():
             raise ValueError(f"Not a directory: {directory}")
         
-        files = list(directory.glob(pattern))
-        results = {}
+        files = list(_find_files(directory, pattern))
+        chunk_size = None
+        if self.backend == "process" and not self.chunk_size:
+            # The file count is known, so split into a few batches per worker
+            workers = self.max_workers or os.cpu_count() or 1
+            chunk_size = max(1, -(-len(files) // (workers * BATCHES_PER_WORKER)))
+        return dict(self.iter_files(files, chunk_size=chunk_size))
+    
+    def iter_directory(
+        self,
+        directory: Union[str, Path],
+        pattern: Optional[str] = "**/*.py",
+        ordered: bool = False,
+        max_in_flight: Optional[int] = None
+    ) -> Iterator[Tuple[str, CodeMetrics]]:
+        """Yield (path, metrics) for matching files as they are analyzed.
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_file = {
-                executor.submit(self.analyze_file, file): file
-                for file in files
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_file):
-                file = future_to_file[future]
-                try:
-                    metrics = future.result()
-                    if metrics:
-                        results[str(file)] = metrics
-                except Exception as e:
-                    print(f"Error processing {file}: {e}")
+        Files are discovered lazily, so the first results arrive before the
+        directory has been fully listed.
         
-        return results
+        Args:
+            directory: Directory to analyze
+            pattern: Glob pattern of files to analyze, or None for every
+                file that has a registered analyzer
+            ordered: Yield results in discovery order instead of completion order
+            max_in_flight: Maximum number of pending work units (files, or
+                batches for the process backend)
+        
+        Raises:
+            ValueError: If directory is not a directory
+        """
+        directory = Path(directory)
+        if not directory.is_dir():
+            raise ValueError(f"Not a directory: {directory}")
+        return self.iter_files(_find_files(directory, pattern), ordered, max_in_flight)
+    
+    def analyze_changes(
+        self,
+        repo: Union[str, Path] = ".",
+        revision: str = "HEAD",
+        pattern: Optional[str] = "*.py"
+    ) -> ChangeSet:
+        """Analyze only the files changed in git, reusing cached metrics for the rest.
+        
+        Changed files come from ``git diff --name-only``: a single revision
+        compares it with the working tree, ``A..B`` compares two commits.
+        Untracked files that are not ignored count as changed. Unchanged
+        files are matched to cache entries through the blob IDs in the git
+        index, so they are neither parsed nor read and the cost grows with
+        the size of the diff. Unchanged files without a matching entry
+        (never cached, or checked out with different line endings) go
+        through the regular cache lookup and are parsed if that misses too,
+        so the change set always covers every selected file.
+        
+        Args:
+            repo: Any path inside the repository
+            revision: Revision or revision range to diff against
+            pattern: Pattern file paths must match (PurePath.match), or None
+                for every file that has a registered analyzer
+        
+        Raises:
+            ValueError: If git fails
+        """
+        root = Path(_git(repo, "rev-parse", "--show-toplevel").decode().strip())
+        
+        def selected(name: str) -> bool:
+            return PurePosixPath(name).match(pattern) if pattern else AnalyzerFactory.supports(name)
+        
+        diff = _git(root, "diff", "--name-only", "--no-renames", "-z", revision, "--")
+        untracked = _git(root, "ls-files", "--others", "--exclude-standard", "-z")
+        names = {os.fsdecode(name) for name in (diff + untracked).split(b"\0") if name}
+        changes = ChangeSet()
+        existing = []
+        for name in sorted(filter(selected, names)):
+            file = root / name
+            if file.is_file():
+                existing.append(file)
+            else:
+                changes.deleted.append(str(file))
+        changes.changed = dict(self.iter_files(existing))
+        
+        # Index entries are "<mode> <blob id> <stage>\t<path>"
+        digests = {}
+        for entry in _git(root, "ls-files", "--stage", "-z").split(b"\0"):
+            if not entry:
+                continue
+            info, _, name = entry.partition(b"\t")
+            name = os.fsdecode(name)
+            if name not in names and selected(name):
+                digests[str(root / name)] = info.split()[1].decode()
+        if self.cache_path:
+            with MetricsCache(self.cache_path) as cache:
+                changes.unchanged = cache.get_by_hash(digests)
+        missed = sorted(path for path in digests if path not in changes.unchanged)
+        changes.unchanged.update(self.iter_files(missed))
+        return changes
+    
+    def analyze_table(self, directory: Union[str, Path], pattern: Optional[str] = "**/*.py") -> MetricsTable:
+        """Analyze all matching files into a columnar MetricsTable.
+        
+        Results are streamed into the table, so no per-file CodeMetrics
+        objects are kept alive.
+        """
+        return MetricsTable.from_results(self.iter_directory(directory, pattern))
+    
+    def analyze_graph(self, directory: Union[str, Path], pattern: Optional[str] = "**/*.py") -> ImportGraph:
+        """Analyze all matching files into an ImportGraph rooted at directory."""
+        return ImportGraph.from_results(directory, self.iter_directory(directory, pattern))
+    
+    async def aiter_directory(
+        self,
+        directory: Union[str, Path],
+        pattern: Optional[str] = "**/*.py",
+        ordered: bool = False,
+        max_in_flight: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, CodeMetrics]]:
+        """Async variant of iter_directory that keeps the event loop free."""
+        loop = asyncio.get_running_loop()
+        results = self.iter_directory(directory, pattern, ordered, max_in_flight)
+        done = object()
+        while True:
+            item = await loop.run_in_executor(None, next, results, done)
+            if item is done:
+                break
+            yield item
+    
+    def iter_files(
+        self,
+        files: Iterable[Union[str, Path]],
+        ordered: bool = False,
+        max_in_flight: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[Tuple[str, CodeMetrics]]:
+        """Yield (path, metrics) for files as they are analyzed.
+        
+        At most ``max_in_flight`` work units are pending at once, so memory
+        stays flat however many files there are. Cached results are yielded
+        without being sent to a worker; files whose size or mtime changed
+        are hashed by the worker that reads them.
+        
+        Args:
+            files: Files to analyze, consumed lazily
+            ordered: Yield results in input order instead of completion order
+            max_in_flight: Maximum number of pending work units (default:
+                BATCHES_PER_WORKER per worker)
+            chunk_size: Files per process batch (default: the analyzer's
+                chunk_size, or STREAM_CHUNK_SIZE)
+        """
+        process = self.backend == "process"
+        if process:
+            workers = self.max_workers or os.cpu_count() or 1
+            executor_class = concurrent.futures.ProcessPoolExecutor
+            chunk_size = chunk_size or self.chunk_size or STREAM_CHUNK_SIZE
+        else:
+            # Same default as ThreadPoolExecutor
+            workers = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+            executor_class = concurrent.futures.ThreadPoolExecutor
+            chunk_size = 1
+        max_in_flight = max_in_flight or workers * BATCHES_PER_WORKER
+        
+        cache = MetricsCache(self.cache_path) if self.cache_path else None
+        keys: Dict[str, Tuple] = {}
+        fresh: List[Tuple[Tuple, str, CodeMetrics]] = []
+        pending: Deque[concurrent.futures.Future] = collections.deque()
+        future_to_batch: Dict[concurrent.futures.Future, List[Tuple[str, Optional[str]]]] = {}
+        
+        def collect(future: concurrent.futures.Future) -> Iterator[Tuple[str, CodeMetrics]]:
+            """Yield the results of a finished work unit, caching fresh ones."""
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"Error processing {future_to_batch[future][0][0]}: {e}")
+                results = []
+            finally:
+                del future_to_batch[future]
+            for path, metrics, digest in results:
+                key = keys.pop(path, None)
+                if metrics is None:
+                    # A worker found the content unchanged and did not parse it
+                    if key and digest is not None and digest == key[3]:
+                        metrics = cache.revalidate(key)
+                    if metrics is None:
+                        continue
+                else:
+                    if isinstance(metrics, tuple):
+                        metrics = CodeMetrics.unpack(metrics)
+                    if key and digest is not None:
+                        fresh.append((key, digest, metrics))
+                yield path, metrics
+            if cache and len(fresh) >= CACHE_WRITE_BATCH:
+                cache.store(fresh)
+                fresh.clear()
+        
+        def drain(limit: int) -> Iterator[Tuple[str, CodeMetrics]]:
+            """Collect finished units until fewer than limit are pending."""
+            while len(pending) > limit:
+                if ordered:
+                    yield from collect(pending.popleft())
+                    continue
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield from collect(future)
+        
+        def cached(path: str, metrics: CodeMetrics) -> concurrent.futures.Future:
+            """Wrap a cache hit as an already finished work unit."""
+            future = concurrent.futures.Future()
+            future.set_result([(path, metrics, None)])
+            return future
+        
+        try:
+            with executor_class(max_workers=workers) as executor:
+                hashed = cache is not None
+                submit = (
+                    (lambda batch: executor.submit(_analyze_batch, batch, self.max_file_size, hashed)) if process
+                    else (lambda batch: executor.submit(self._analyze_paths, batch, hashed))
+                )
+                batch: List[Tuple[str, Optional[str]]] = []
+                for file in files:
+                    path = str(file)
+                    known_hash = None
+                    if cache:
+                        metrics, key = cache.get(path)
+                        if metrics:
+                            future = cached(path, metrics)
+                            future_to_batch[future] = [(path, None)]
+                            pending.append(future)
+                            yield from drain(max_in_flight - 1)
+                            continue
+                        if key:
+                            keys[path] = key
+                            known_hash = key[3]
+                    batch.append((path, known_hash))
+                    if len(batch) >= chunk_size:
+                        future = submit(batch)
+                        future_to_batch[future] = batch
+                        pending.append(future)
+                        batch = []
+                        yield from drain(max_in_flight - 1)
+                
+                if batch:
+                    future = submit(batch)
+                    future_to_batch[future] = batch
+                    pending.append(future)
+                yield from drain(0)
+        finally:
+            if cache:
+                if fresh:
+                    cache.store(fresh)
+                cache.close()
+    
+    def _analyze_paths(
+        self,
+        items: List[Tuple[str, Optional[str]]],
+        hashed: bool
+    ) -> List[Tuple[str, Optional[CodeMetrics], Optional[str]]]:
+        """Analyze a batch of (path, cached hash) items in a worker thread."""
+        return [(path, *self._analyze_file(path, hashed, known_hash)) for path, known_hash in items]
+
+def write_jsonl(results: Iterable[Tuple[str, CodeMetrics]], output: Union[str, Path, IO[str]]) -> int:
+    """Stream (path, metrics) pairs to a JSON Lines file as they arrive.
+    
+    Each line is flushed immediately, so consumers can follow the output
+    while the analysis is still running.
+    
+    Args:
+        results: Pairs from iter_directory() or iter_files()
+        output: File path, or an open text stream
+    
+    Returns:
+        Number of records written
+    """
+    if isinstance(output, (str, Path)):
+        with open(output, "w", encoding="utf-8") as f:
+            return write_jsonl(results, f)
+    
+    count = 0
+    for path, metrics in results:
+        output.write(json.dumps({"path": path, **metrics.to_dict()}) + "\n")
+        output.flush()
+        count += 1
+    return count
+
+def _ask_pattern() -> Optional[str]:
+    """Ask for a file pattern; "all" selects every supported language."""
+    pattern = input("Enter file pattern (default: **/*.py, 'all' for every supported language): ").strip()
+    if pattern == "all":
+        return None
+    return pattern or "**/*.py"
 
 def main():
     """Main program."""
-    analyzer = CodeAnalyzer()
+    analyzer = CodeAnalyzer(backend="process", cache_path=DEFAULT_CACHE_PATH)
     
     while True:
         print("\n🔍 Code Analyzer Menu:")
         print("1. Analyze File")
         print("2. Analyze Directory")
-        print("3. Exit")
+        print("3. Export Directory Analysis (JSONL)")
+        print("4. Repository Summary")
+        print("5. Import Impact")
+        print("6. Analyze Git Changes")
+        print("7. Exit")
         
-        choice = input("\nWhat would you like to do? (1-3): ")
+        choice = input("\nWhat would you like to do? (1-7): ")
         
         if choice == "1":
             file_path = input("Enter file path: ")
@@ -219,18 +1510,89 @@ def main():
         
         elif choice == "2":
             directory = input("Enter directory path: ")
-            pattern = input("Enter file pattern (default: **/*.py): ").strip() or "**/*.py"
+            pattern = _ask_pattern()
             
             try:
-                results = analyzer.analyze_directory(directory, pattern)
                 print("\nAnalysis Results:")
-                for file, metrics in results.items():
+                for file, metrics in analyzer.iter_directory(directory, pattern, ordered=True):
                     print(f"\n{file}:")
                     print(json.dumps(metrics.to_dict(), indent=2))
             except ValueError as e:
                 print(f"Error: {e}")
         
         elif choice == "3":
+            directory = input("Enter directory path: ")
+            pattern = _ask_pattern()
+            output = input("Enter output file (default: metrics.jsonl): ").strip() or "metrics.jsonl"
+            
+            try:
+                count = write_jsonl(analyzer.iter_directory(directory, pattern), output)
+                print(f"\n✅ Wrote {count} results to {output}")
+            except ValueError as e:
+                print(f"Error: {e}")
+        
+        elif choice == "4":
+            directory = input("Enter directory path: ")
+            pattern = _ask_pattern()
+            
+            try:
+                table = analyzer.analyze_table(directory, pattern)
+            except ValueError as e:
+                print(f"Error: {e}")
+                continue
+            
+            print("\nRepository Totals:")
+            print(json.dumps(table.totals(), indent=2))
+            print("\nComplexity Percentiles:")
+            for percent, value in table.percentiles("complexity").items():
+                print(f"  p{percent}: {value}")
+            print("\nMost Complex Files:")
+            for file, complexity in table.top("complexity", 10):
+                print(f"  {complexity:6d}  {file}")
+            print("\nMost Common Dependencies:")
+            for name, count in table.dependency_counts(10):
+                print(f"  {count:6d}  {name}")
+        
+        elif choice == "5":
+            directory = input("Enter directory path: ")
+            changed = input("Enter changed files, relative to the directory (space separated): ").split()
+            
+            try:
+                graph = analyzer.analyze_graph(directory)
+            except ValueError as e:
+                print(f"Error: {e}")
+                continue
+            
+            print("\nFiles affected by the change:")
+            for file in sorted(graph.impact(str(Path(directory) / name) for name in changed)):
+                print(f"  {file}")
+            cycles = graph.cycles()
+            print(f"\nImport cycles: {len(cycles)}")
+            for cycle in cycles[:5]:
+                print("  " + " -> ".join(graph.paths[path] for path in cycle))
+        
+        elif choice == "6":
+            repo = input("Enter repository path (default: .): ").strip() or "."
+            revision = input("Enter revision or range (default: HEAD): ").strip() or "HEAD"
+            
+            try:
+                changes = analyzer.analyze_changes(repo, revision)
+            except ValueError as e:
+                print(f"Error: {e}")
+                continue
+            
+            print("\nChanged Files:")
+            for file, metrics in sorted(changes.changed.items()):
+                print(f"\n{file}:")
+                print(json.dumps(metrics.to_dict(), indent=2))
+            for file in changes.deleted:
+                print(f"\n{file}: deleted")
+            
+            table = MetricsTable.from_results(changes.results.items())
+            print(f"\nRepository Totals ({len(changes.changed)} changed, {len(changes.unchanged)} unchanged files):")
+            print(json.dumps(table.totals(), indent=2))
+        
+        elif choice == "7":
             print("Goodbye! 👋")
             break
         
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Reproducible benchmarks for the Cultural Probes pipeline.
+
+Usage:
+    python benchmarks/run_benchmarks.py run [--quick] [--only NAME ...]
+    python benchmarks/run_benchmarks.py compare BASELINE.json CURRENT.json
+
+Each benchmark runs in a fresh process against synthetic data, so peak
+RSS is measured per benchmark. Results are written as machine-tagged JSON
+to benchmarks/results/.
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+RESULTS_DIR = BENCH_DIR / "results"
+
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(REPO_ROOT))
+
+import synthetic  # noqa: E402
+
+# Default problem sizes; --quick divides them to keep CI runs short
+DEFAULT_PARAMS: Dict[str, Dict[str, int]] = {
+    "store_response": {"iterations": 2000},
+    "submit": {"iterations": 5, "responses": 200},
+    "protect_directory": {"iterations": 5, "depth": 4, "fanout": 4, "files_per_dir": 5},
+    "calculate_checksum": {"iterations": 10, "size_mb": 64},
+}
+QUICK_DIVISOR = 10
+
+def _peak_rss_mb() -> float:
+    """Get the peak resident set size of this process in MB."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        try:
+            import psutil
+            info = psutil.Process().memory_info()
+            return getattr(info, "peak_wset", info.rss) / 1024 / 1024
+        except ImportError:
+            return 0.0
+
+def _percentile(samples: List[float], percent: float) -> float:
+    """Get a nearest-rank percentile of sorted samples."""
+    if not samples:
+        return 0.0
+    rank = max(1, -(-len(samples) * percent // 100))
+    return samples[int(rank) - 1]
+
+def _summarize(samples_ns: List[int], units_per_op: float = 1.0) -> Dict[str, float]:
+    """Summarize per-iteration latencies.
+    
+    Args:
+        samples_ns: Latency of each iteration in ns
+        units_per_op: Work units (e.g. MB) processed per iteration
+    
+    Returns:
+        Latency statistics in seconds plus throughput in units per second
+    """
+    samples = sorted(s / 1e9 for s in samples_ns)
+    total = sum(samples)
+    return {
+        "iterations": len(samples),
+        "throughput": len(samples) * units_per_op / total if total else 0.0,
+        "mean": total / len(samples),
+        "min": samples[0],
+        "max": samples[-1],
+        "p50": _percentile(samples, 50),
+        "p90": _percentile(samples, 90),
+        "p99": _percentile(samples, 99),
+    }
+
+def _time_iterations(
+    iterations: int,
+    operation: Callable[[int], Any],
+    reset: Optional[Callable[[], Any]] = None
+) -> List[int]:
+    """Time ``operation(i)`` for each iteration after one warm-up call.
+    
+    Args:
+        iterations: Number of timed iterations
+        operation: Work to time
+        reset: Untimed cleanup run after every call
+    """
+    operation(-1)
+    if reset:
+        reset()
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        operation(i)
+        samples.append(time.perf_counter_ns() - start)
+        if reset:
+            reset()
+    return samples
+
+def bench_store_response(workdir: Path, iterations: int) -> Tuple[List[int], float, str]:
+    """Benchmark ProbeManager.store_response."""
+    from probe_manager import ProbeManager
+    
+    synthetic.make_workspace(workdir)
+    os.chdir(workdir)
+    manager = ProbeManager("probe_config.yaml")
+    response = synthetic.paragraph(random.Random(0), 200)
+    
+    samples = _time_iterations(
+        iterations,
+        lambda i: manager.store_response("environment", "Benchmark prompt?", response)
+    )
+    return samples, 1.0, "responses/s"
+
+def bench_submit(workdir: Path, iterations: int, responses: int) -> Tuple[List[int], float, str]:
+    """Benchmark ProbeSubmission.submit on N responses."""
+    from cultural_probes.submission import ProbeSubmission
+    
+    config_path = synthetic.make_workspace(workdir)
+    synthetic.make_responses(workdir / ".probe_responses", responses)
+    
+    def submit(i: int) -> None:
+        submission = ProbeSubmission(str(config_path))
+        submission.submission_id = f"bench_{i + 1:06d}"
+        with contextlib.redirect_stdout(io.StringIO()):
+            if not submission.submit():
+                raise RuntimeError("Submission failed")
+    
+    return _time_iterations(iterations, submit), 1.0, "submissions/s"
+
+def bench_protect_directory(
+    workdir: Path, iterations: int, depth: int, fanout: int, files_per_dir: int
+) -> Tuple[List[int], float, str]:
+    """Benchmark FileProtection.protect_directory on a deep tree."""
+    from cultural_probes.core.file_protection import FileProtection
+    
+    tree = workdir / "protected"
+    entries = synthetic.make_tree(tree, depth, fanout, files_per_dir)
+    
+    samples = _time_iterations(
+        iterations,
+        lambda i: FileProtection.protect_directory(tree),
+        reset=lambda: FileProtection.unprotect_directory(tree)
+    )
+    return samples, float(entries), "entries/s"
+
+def bench_calculate_checksum(workdir: Path, iterations: int, size_mb: int) -> Tuple[List[int], float, str]:
+    """Benchmark calculate_checksum on a large file."""
+    from cultural_probes.core.utils import calculate_checksum
+    
+    blob = synthetic.make_blob(workdir / "archive.zip", size_mb * 1024 * 1024)
+    samples = _time_iterations(iterations, lambda i: calculate_checksum(blob))
+    return samples, float(size_mb), "MB/s"
+
+BENCHMARKS: Dict[str, Callable[..., Tuple[List[int], float, str]]] = {
+    "store_response": bench_store_response,
+    "submit": bench_submit,
+    "protect_directory": bench_protect_directory,
+    "calculate_checksum": bench_calculate_checksum,
+}
+
+def _run_case(name: str, params: Dict[str, int]) -> Dict[str, Any]:
+    """Run one benchmark; executed in a fresh worker process."""
+    import logging
+    logging.disable(logging.CRITICAL)
+    
+    with tempfile.TemporaryDirectory(prefix=f"probe_bench_{name}_") as tmp:
+        cwd = os.getcwd()
+        try:
+            samples, units, unit_name = BENCHMARKS[name](Path(tmp), **params)
+        finally:
+            os.chdir(cwd)
+    
+    result = _summarize(samples, units)
+    result.update({
+        "unit": unit_name,
+        "params": params,
+        "peak_rss_mb": _peak_rss_mb(),
+    })
+    return result
+
+def machine_info() -> Dict[str, Any]:
+    """Describe the machine the benchmarks ran on."""
+    return {
+        "tag": re.sub(r"[^A-Za-z0-9_.-]", "_", f"{platform.node()}-{platform.machine()}"),
+        "os": platform.system(),
+        "os_version": platform.release(),
+        "cpu_count": os.cpu_count(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+    }
+
+def run(names: List[str], quick: bool, output: Optional[Path]) -> Path:
+    """Run benchmarks and store their results.
+    
+    Returns:
+        Path of the written results file
+    """
+    machine = machine_info()
+    results: Dict[str, Any] = {}
+    context = multiprocessing.get_context("spawn")
+    
+    for name in names:
+        params = dict(DEFAULT_PARAMS[name])
+        if quick:
+            params = {
+                key: max(1, value // QUICK_DIVISOR) if key in ("iterations", "responses", "size_mb") else value
+                for key, value in params.items()
+            }
+        print(f"⏱️  {name} {params}")
+        with context.Pool(1) as pool:
+            try:
+                result = pool.apply(_run_case, (name, params))
+            except ImportError as e:
+                print(f"   Skipped: {e}")
+                continue
+        results[name] = result
+        print(
+            f"   {result['throughput']:.1f} {result['unit']} | "
+            f"p50 {result['p50'] * 1000:.2f}ms | p99 {result['p99'] * 1000:.2f}ms | "
+            f"peak RSS {result['peak_rss_mb']:.1f}MB"
+        )
+    
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    if output is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        output = RESULTS_DIR / f"{machine['tag']}_{timestamp}.json"
+    with open(output, "w") as f:
+        json.dump({
+            "timestamp": timestamp,
+            "quick": quick,
+            "machine": machine,
+            "benchmarks": results,
+        }, f, indent=2)
+    print(f"\n📁 Results written to: {output}")
+    return output
+
+def compare(baseline_path: Path, current_path: Path, threshold: float) -> bool:
+    """Compare two results files and report regressions.
+    
+    A benchmark regresses when its p50 latency grows or its throughput
+    drops by more than ``threshold`` (a fraction).
+    
+    Returns:
+        True if no benchmark regressed
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(current_path) as f:
+        current = json.load(f)
+    
+    if baseline["machine"]["tag"] != current["machine"]["tag"]:
+        print(
+            f"⚠️  Comparing different machines: "
+            f"{baseline['machine']['tag']} vs {current['machine']['tag']}"
+        )
+    
+    ok = True
+    for name, base in baseline["benchmarks"].items():
+        result = current["benchmarks"].get(name)
+        if result is None:
+            print(f"   {name}: missing from current results")
+            continue
+        if result["params"] != base["params"]:
+            print(f"   {name}: parameters differ, skipped")
+            continue
+        
+        latency_change = result["p50"] / base["p50"] - 1 if base["p50"] else 0.0
+        throughput_change = result["throughput"] / base["throughput"] - 1 if base["throughput"] else 0.0
+        regressed = latency_change > threshold or throughput_change < -threshold
+        ok = ok and not regressed
+        print(
+            f"{'❌' if regressed else '✅'} {name}: "
+            f"p50 {latency_change:+.1%} | throughput {throughput_change:+.1%} | "
+            f"peak RSS {base['peak_rss_mb']:.1f} -> {result['peak_rss_mb']:.1f}MB"
+        )
+    return ok
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point for the benchmark runner."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    run_parser = commands.add_parser("run", help="Run benchmarks")
+    run_parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run")
+    run_parser.add_argument("--quick", action="store_true", help="Use reduced problem sizes")
+    run_parser.add_argument("--output", type=Path, help="Results file (default: benchmarks/results/)")
+    
+    compare_parser = commands.add_parser("compare", help="Compare results against a baseline")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="Allowed relative slowdown before flagging a regression (default: 0.10)"
+    )
+    
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        run(args.only or list(BENCHMARKS), args.quick, args.output)
+        return 0
+    return 0 if compare(args.baseline, args.current, args.threshold) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Synthetic data generators for the Cultural Probes benchmarks."""
+
+import os
+import random
+import shutil
+from pathlib import Path
+from typing import List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+PROBE_TYPES = ["environment", "tools", "workflow", "sustainability"]
+
+WORDS = (
+    "code debug focus flow editor terminal refactor test review deploy "
+    "coffee desk monitor keyboard quiet music pair branch commit merge"
+).split()
+
+def paragraph(rng: random.Random, words: int) -> str:
+    """Generate a paragraph of pseudo-random words."""
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+def make_workspace(root: Path) -> Path:
+    """Create a workspace with the repository config and probe directories.
+    
+    Args:
+        root: Empty directory to populate
+    
+    Returns:
+        Path to the workspace's probe_config.yaml
+    """
+    config_path = root / "probe_config.yaml"
+    shutil.copy(REPO_ROOT / "probe_config.yaml", config_path)
+    for directory in (".probe_responses", "04_submission/submissions", "04_submission/templates"):
+        (root / directory).mkdir(parents=True, exist_ok=True)
+    return config_path
+
+def make_responses(directory: Path, count: int, words: int = 200, seed: int = 0) -> List[Path]:
+    """Write ``count`` markdown probe responses.
+    
+    Args:
+        directory: Response directory
+        count: Number of responses
+        words: Words per response body
+        seed: Random seed, so runs are reproducible
+    
+    Returns:
+        Paths of the written responses
+    """
+    rng = random.Random(seed)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        probe_type = PROBE_TYPES[i % len(PROBE_TYPES)]
+        path = directory / f"{probe_type}_{i:06d}.md"
+        path.write_text(
+            f"# Probe Response\n\n## Type\n{probe_type}\n\n"
+            f"## Prompt\n{paragraph(rng, 12)}\n\n"
+            f"## Response\n{paragraph(rng, words)}\n\n"
+            f"## Timestamp\n2024-01-01T00:00:{i % 60:02d}\n"
+        )
+        paths.append(path)
+    return paths
+
+def make_blob(path: Path, size: int, seed: int = 0) -> Path:
+    """Write a single binary file of ``size`` bytes."""
+    rng = random.Random(seed)
+    chunk = 1024 * 1024
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            n = min(chunk, remaining)
+            f.write(rng.randbytes(n) if hasattr(rng, "randbytes") else os.urandom(n))
+            remaining -= n
+    return path
+
+def make_tree(root: Path, depth: int, fanout: int, files_per_dir: int) -> int:
+    """Create a directory tree for protection benchmarks.
+    
+    Args:
+        root: Tree root
+        depth: Number of directory levels below the root
+        fanout: Subdirectories per directory
+        files_per_dir: Small files per directory
+    
+    Returns:
+        Total number of files and directories created
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    created = 0
+    level = [root]
+    for current_depth in range(depth + 1):
+        next_level = []
+        for directory in level:
+            for i in range(files_per_dir):
+                (directory / f"note_{i}.md").write_text("probe\n")
+                created += 1
+            if current_depth < depth:
+                for i in range(fanout):
+                    child = directory / f"d{i}"
+                    child.mkdir()
+                    next_level.append(child)
+                    created += 1
+        level = next_level
+    return created
@@ -0,0 +1 @@
+"""Core utilities shared by the Cultural Probes tools."""
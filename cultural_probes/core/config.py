@@ -1,7 +1,6 @@
 """Configuration management for Cultural Probes."""
 
 import functools
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from cachetools import TTLCache, cached
@@ -43,6 +42,8 @@ def _setup_directories(self) -> None:
     @cached(_config_cache)
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file with caching."""
+        import yaml
+        
         try:
             with open(self.config_path) as f:
                 return yaml.safe_load(f)
@@ -56,7 +57,7 @@ def _load_and_validate_config(self) -> None:
     
     def _validate_config(self) -> None:
         """Validate configuration structure."""
-        required_sections = {'directories', 'security', 'submission'}
+        required_sections = {'directories', 'submission_settings'}
         missing = required_sections - set(self.config.keys())
         if missing:
             raise ConfigError(f"Missing required sections: {missing}")
@@ -65,13 +66,19 @@ def _validate_config(self) -> None:
     @functools.lru_cache()
     def security_settings(self) -> Dict[str, Any]:
         """Get security settings with caching."""
-        return self.config.get('security', {})
+        return self.submission_settings.get('security', {})
     
     @property
     @functools.lru_cache()
     def submission_settings(self) -> Dict[str, Any]:
         """Get submission settings with caching."""
-        return self.config.get('submission', {})
+        return self.config.get('submission_settings', {})
+    
+    @property
+    @functools.lru_cache()
+    def performance_settings(self) -> Dict[str, Any]:
+        """Get performance monitoring settings with caching."""
+        return self.config.get('performance', {})
     
     def get_path(self, name: str) -> Optional[Path]:
         """Get a configured path by name."""
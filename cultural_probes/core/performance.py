@@ -1,16 +1,45 @@
 """Performance monitoring utilities for Cultural Probes."""
 
+import os
 import time
+import datetime
 import functools
+import inspect
+import itertools
 import logging
-from concurrent_log_handler import ConcurrentRotatingFileHandler
+import queue
+import threading
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from .config import ProbeConfig
 
 # Type variables for generic function decorators
 F = TypeVar('F', bound=Callable[..., Any])
 
+# Histogram resolution: 2**_SUB_BUCKET_BITS linear sub-buckets per power of two
+_SUB_BUCKET_BITS = 3
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+
+# Marker for lazily resolved attributes
+_UNRESOLVED = object()
+
+# Log handlers by absolute log file path, shared by all monitors so that
+# repeated construction never stacks handlers on the 'performance' logger
+_handlers: Dict[str, logging.Handler] = {}
+_handlers_lock = threading.Lock()
+
+# Serializes appends to memory profile reports
+_report_lock = threading.Lock()
+
+# Memory-profiled calls in progress. The tracemalloc peak is process-wide,
+# so before a call resets it the peak so far is credited to every open call
+_open_samples: Set['_Sample'] = set()
+_samples_lock = threading.Lock()
+
 @dataclass
 class PerformanceMetrics:
     """Container for performance metrics."""
@@ -20,86 +49,773 @@ class PerformanceMetrics:
     timestamp: float
     success: bool
     error: Optional[str] = None
+    first_item_time: Optional[float] = None
+    items: Optional[int] = None
+    peak_memory: Optional[float] = None
+    top_allocations: Optional[List[str]] = None
+
+class _Sample:
+    """Baseline captured at the start of a sampled call."""
+    
+    __slots__ = ('memory', 'snapshot', 'traced', 'peak')
+    
+    def __init__(self, memory: float, snapshot: Any = None, traced: int = 0):
+        self.memory = memory
+        self.snapshot = snapshot
+        self.traced = traced
+        # Highest traced memory seen before a nested call reset the peak
+        self.peak = 0
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (HDR-style) over nanosecond values.
+    
+    Values below ``2**_SUB_BUCKET_BITS`` get exact buckets; above that each
+    power of two is split into equal sub-buckets, bounding the relative
+    error of any reported percentile to roughly 12.5%.
+    """
+    
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+    
+    @staticmethod
+    def _bucket_index(value: int) -> int:
+        """Map a value to its bucket index."""
+        if value < _SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+        return ((shift + 1) << _SUB_BUCKET_BITS) + (value >> shift) - _SUB_BUCKETS
+    
+    @staticmethod
+    def _bucket_bounds(index: int) -> Tuple[int, int]:
+        """Get the inclusive lower and exclusive upper bound of a bucket."""
+        if index < _SUB_BUCKETS:
+            return index, index + 1
+        shift = (index >> _SUB_BUCKET_BITS) - 1
+        lower = ((index & (_SUB_BUCKETS - 1)) + _SUB_BUCKETS) << shift
+        return lower, lower + (1 << shift)
+    
+    def record(self, value: int) -> None:
+        """Record a single value."""
+        index = self._bucket_index(max(value, 0))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+    
+    def percentile(self, percent: float) -> int:
+        """Get an estimate of the given percentile (0-100).
+        
+        Returns:
+            Midpoint of the bucket holding the percentile, 0 when empty
+        """
+        if not self.total:
+            return 0
+        rank = max(1, -(-self.total * percent // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lower, upper = self._bucket_bounds(index)
+                return (lower + upper - 1) // 2
+        return 0
+
+class FunctionStats:
+    """Running aggregates for a single measured function."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+        self.histogram = LatencyHistogram()
+    
+    def record(self, elapsed_ns: int, success: bool) -> None:
+        """Add one call to the aggregates."""
+        with self._lock:
+            self.count += 1
+            if not success:
+                self.errors += 1
+            self.total_ns += elapsed_ns
+            if self.min_ns is None or elapsed_ns < self.min_ns:
+                self.min_ns = elapsed_ns
+            if elapsed_ns > self.max_ns:
+                self.max_ns = elapsed_ns
+            self.histogram.record(elapsed_ns)
+    
+    def _percentile(self, percent: float) -> int:
+        """Histogram percentile, clamped to the observed range."""
+        value = self.histogram.percentile(percent)
+        return min(max(value, self.min_ns or 0), self.max_ns)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the aggregates with times in seconds."""
+        with self._lock:
+            return {
+                "count": self.count,
+                "errors": self.errors,
+                "total": self.total_ns / 1e9,
+                "mean": self.total_ns / self.count / 1e9 if self.count else 0.0,
+                "min": (self.min_ns or 0) / 1e9,
+                "max": self.max_ns / 1e9,
+                "p50": self._percentile(50) / 1e9,
+                "p90": self._percentile(90) / 1e9,
+                "p99": self._percentile(99) / 1e9,
+            }
+
+class QueuedLogHandler(logging.Handler):
+    """Logging handler that hands records to a background writer thread.
+    
+    Records are placed on a bounded in-memory queue and written to the
+    target handler in batches, so callers never wait on disk or on the
+    target's file lock. The target should use a message-only formatter;
+    records are formatted with this handler's formatter.
+    """
+    
+    _STOP = object()
+    
+    def __init__(
+        self,
+        target: logging.Handler,
+        capacity: int = 10000,
+        overflow: str = 'drop',
+        batch_size: int = 256
+    ):
+        """Initialize queued handler.
+        
+        Args:
+            target: Handler that performs the actual writes
+            capacity: Maximum number of queued records
+            overflow: 'drop' to discard records when the queue is full,
+                'block' to wait for space
+            batch_size: Maximum number of records written per batch
+        """
+        if overflow not in ('drop', 'block'):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        
+        super().__init__()
+        self.target = target
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.capacity = capacity
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._closing = False
+        self._start_writer()
+        
+        if hasattr(os, 'register_at_fork'):
+            # The writer thread does not survive fork(); give the child its own
+            os.register_at_fork(after_in_child=functools.partial(_restart_writer, weakref.ref(self)))
+    
+    def _start_writer(self) -> None:
+        """Create a fresh queue and start the writer thread draining it."""
+        self.queue: queue.Queue = queue.Queue(maxsize=self.capacity)
+        self._writer = threading.Thread(
+            target=self._run,
+            name='performance-log-writer',
+            daemon=True
+        )
+        self._writer.start()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue a record for the writer thread."""
+        try:
+            self.queue.put(record, block=self.overflow == 'block')
+        except queue.Full:
+            self.dropped += 1
+        except Exception:
+            self.handleError(record)
+    
+    def _run(self) -> None:
+        """Drain the queue in batches until stopped."""
+        while True:
+            batch = [self.queue.get()]
+            while batch[-1] is not self._STOP and len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = batch[-1] is self._STOP
+            records = batch[:-1] if stop else batch
+            if records:
+                self._write(records)
+            for _ in batch:
+                self.queue.task_done()
+            if stop:
+                return
+    
+    def _drop_notice(self, name: str) -> Optional[logging.LogRecord]:
+        """Build a warning about records dropped since the last notice, if any."""
+        dropped = self.dropped - self._reported_dropped
+        if not dropped:
+            return None
+        self._reported_dropped += dropped
+        return logging.makeLogRecord({
+            'name': name,
+            'msg': f"Dropped {dropped} log records: queue full ({self.dropped} in total)",
+            'levelno': logging.WARNING,
+            'levelname': logging.getLevelName(logging.WARNING),
+        })
+    
+    def _write(self, records: list) -> None:
+        """Write a batch of records through the target in one call.
+        
+        Drops since the previous batch are reported at the end of the batch.
+        """
+        notice = self._drop_notice(records[-1].name if records else 'performance')
+        if notice is not None:
+            records = [*records, notice]
+        if not records:
+            return
+        try:
+            text = '\n'.join(self.format(record) for record in records)
+            level = max(record.levelno for record in records)
+            self.target.handle(logging.makeLogRecord({
+                'name': records[-1].name,
+                'msg': text,
+                'levelno': level,
+                'levelname': logging.getLevelName(level),
+            }))
+        except Exception:
+            self.handleError(records[-1])
+    
+    def flush(self) -> None:
+        """Wait until every queued record has been written."""
+        if self._writer.is_alive():
+            self.queue.join()
+        self.target.flush()
+    
+    def close(self) -> None:
+        """Write outstanding records and stop the writer thread."""
+        self._closing = True
+        if self._writer.is_alive():
+            self.queue.put(self._STOP)
+            self._writer.join()
+        # Report drops that happened after the last batch was written
+        self._write([])
+        self.target.close()
+        super().close()
+
+def _restart_writer(ref: 'weakref.ref[QueuedLogHandler]') -> None:
+    """Restart a queued handler's writer in a forked child process.
+    
+    Records the parent had queued are left to the parent to write.
+    """
+    handler = ref()
+    if handler is not None and not handler._closing:
+        handler._start_writer()
 
 class PerformanceMonitor:
-    """Performance monitoring and logging utility."""
+    """Performance monitoring and logging utility.
+    
+    Construction is free of side effects: the log directory, file handler
+    and psutil are only touched once there is something to record.
+    """
+    
+    _SETTINGS = {
+        'log_dir', 'sample_rate', 'slow_threshold', 'track_memory',
+        'flush_interval', 'async_logging', 'queue_size', 'overflow',
+        'profile_memory', 'memory_top', 'memory_frames',
+    }
+    _LOG_SETTINGS = ('log_dir', 'async_logging', 'queue_size', 'overflow')
     
-    def __init__(self, log_dir: Path):
+    def __init__(
+        self,
+        log_dir: Path,
+        sample_rate: int = 1,
+        slow_threshold: float = 1.0,
+        track_memory: bool = False,
+        flush_interval: Optional[float] = 60.0,
+        async_logging: bool = True,
+        queue_size: int = 10000,
+        overflow: str = 'drop',
+        profile_memory: bool = False,
+        memory_top: int = 10,
+        memory_frames: int = 1
+    ):
         """Initialize performance monitor.
         
         Args:
             log_dir: Directory for log files
+            sample_rate: Record one in every ``sample_rate`` calls
+            slow_threshold: Calls slower than this (seconds) are always
+                recorded and logged as warnings
+            track_memory: Record the RSS delta of sampled calls
+            flush_interval: Seconds between aggregate snapshots written to
+                the log, or None to only flush on request
+            async_logging: Write log records from a background thread
+            queue_size: Capacity of the background logging queue
+            overflow: 'drop' or 'block' when the logging queue is full
+            profile_memory: Take tracemalloc snapshots around sampled calls
+                and write peak and top allocation sites to
+                memory_profile.log
+            memory_top: Number of allocation sites per memory report
+            memory_frames: Stack frames stored per traced allocation
         """
-        self.log_dir = log_dir
-        self.log_dir.mkdir(exist_ok=True)
-        
-        # Set up logging
         self.logger = logging.getLogger('performance')
         self.logger.setLevel(logging.INFO)
+        self.configure(
+            log_dir=log_dir,
+            sample_rate=sample_rate,
+            slow_threshold=slow_threshold,
+            track_memory=track_memory,
+            flush_interval=flush_interval,
+            async_logging=async_logging,
+            queue_size=queue_size,
+            overflow=overflow,
+            profile_memory=profile_memory,
+            memory_top=memory_top,
+            memory_frames=memory_frames
+        )
+        
+        # psutil handle, resolved on the first memory reading in each process
+        self._process: Any = _UNRESOLVED
+        self._process_pid: Optional[int] = None
+        self._started_tracemalloc = False
+        
+        # Per-function aggregates, updated on every call
+        self._stats: Dict[str, FunctionStats] = {}
+        self._last_flush = time.monotonic()
+        self._unflushed = False
+    
+    def configure(self, **settings: Any) -> None:
+        """Update monitor settings in place.
+        
+        Accepts the keyword arguments of ``__init__``. Changing the log
+        settings detaches the current handler; a new one is created on
+        the next write.
+        
+        Raises:
+            ValueError: If a setting is unknown or invalid
+        """
+        unknown = set(settings) - self._SETTINGS
+        if unknown:
+            raise ValueError(f"Unknown performance settings: {sorted(unknown)}")
+        if settings.get('sample_rate', 1) < 1:
+            raise ValueError("sample_rate must be at least 1")
+        if settings.get('overflow', 'drop') not in ('drop', 'block'):
+            raise ValueError(f"Unknown overflow policy: {settings['overflow']}")
+        
+        if 'log_dir' in settings:
+            settings['log_dir'] = Path(settings['log_dir'])
+        if hasattr(self, '_log_file') and any(
+            settings.get(key, getattr(self, key)) != getattr(self, key)
+            for key in self._LOG_SETTINGS
+        ):
+            self._detach_handler()
+        
+        for key, value in settings.items():
+            setattr(self, key, value)
+        self._log_file = os.path.abspath(self.log_dir / 'performance.log')
+    
+    @property
+    def handler(self) -> logging.Handler:
+        """Log handler for this monitor's log file, created on first use."""
+        return self._ensure_handler()
+    
+    def _ensure_handler(self) -> logging.Handler:
+        """Get the shared handler for the log file, attaching it if needed."""
+        handler = _handlers.get(self._log_file)
+        if handler is None:
+            with _handlers_lock:
+                handler = _handlers.get(self._log_file)
+                if handler is None:
+                    handler = self._create_handler()
+                    _handlers[self._log_file] = handler
+                    self.logger.addHandler(handler)
+        return handler
+    
+    def _create_handler(self) -> logging.Handler:
+        """Create the log directory and file handler."""
+        from concurrent_log_handler import ConcurrentRotatingFileHandler
+        
+        self.log_dir.mkdir(parents=True, exist_ok=True)
         
         # Use thread-safe rotating handler
-        handler = ConcurrentRotatingFileHandler(
-            filename=str(log_dir / 'performance.log'),
+        handler: logging.Handler = ConcurrentRotatingFileHandler(
+            filename=self._log_file,
             maxBytes=1024 * 1024,  # 1MB
             backupCount=5
         )
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
+        if self.async_logging:
+            # Batches arrive pre-formatted from the writer thread
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            handler = QueuedLogHandler(
+                handler, capacity=self.queue_size, overflow=self.overflow
+            )
         handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        return handler
+    
+    def _detach_handler(self) -> None:
+        """Flush, close and detach the handler for this monitor's log file."""
+        with _handlers_lock:
+            handler = _handlers.pop(self._log_file, None)
+        if handler is not None:
+            self.logger.removeHandler(handler)
+            handler.close()
     
     def measure(self, func: F) -> F:
         """Decorator to measure function performance.
         
+        Every call is timed with ``perf_counter_ns``; only sampled calls,
+        slow calls and failures are turned into metrics and logged.
+        Coroutine functions are timed until they complete. Generators and
+        async generators are timed while producing items, and also report
+        the item count and time-to-first-item.
+        
         Args:
             func: Function to measure
             
         Returns:
             Wrapped function with performance monitoring
         """
-        @functools.wraps(func)
+        if inspect.isasyncgenfunction(func):
+            wrapper = self._wrap_async_generator(func)
+        elif inspect.iscoroutinefunction(func):
+            wrapper = self._wrap_coroutine(func)
+        elif inspect.isgeneratorfunction(func):
+            wrapper = self._wrap_generator(func)
+        else:
+            wrapper = self._wrap_function(func)
+        return functools.wraps(func)(wrapper)  # type: ignore
+    
+    @staticmethod
+    def _stats_key(func: Callable[..., Any]) -> str:
+        """Key aggregates by qualified name, so same-named functions stay apart."""
+        return f"{func.__module__}.{func.__qualname__}"
+    
+    def _wrap_function(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a plain synchronous function."""
+        calls = itertools.count()
+        key = self._stats_key(func)
+        
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            sample, start = self._start(calls)
+            error = None
+            
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                error = str(e)
+                raise
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                self._finish(key, func.__name__, sample, elapsed, error)
+        return wrapper
+    
+    def _wrap_coroutine(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a coroutine function, timing the awaited execution."""
+        calls = itertools.count()
+        key = self._stats_key(func)
+        
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            sample, start = self._start(calls)
+            error = None
+            
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                error = str(e)
+                raise
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                self._finish(key, func.__name__, sample, elapsed, error)
+        return wrapper
+    
+    def _wrap_generator(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a generator function, timing only time spent producing items."""
+        calls = itertools.count()
+        key = self._stats_key(func)
+        
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
-            start_memory = self._get_memory_usage()
+            sample, _ = self._start(calls)
+            error = None
+            busy = 0
+            items = 0
+            first_item = None
             
             try:
-                result = func(*args, **kwargs)
-                success = True
-                error = None
+                generator = func(*args, **kwargs)
+                resume, value = generator.send, None
+                while True:
+                    resumed = time.perf_counter_ns()
+                    try:
+                        item = resume(value)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        busy += time.perf_counter_ns() - resumed
+                    
+                    items += 1
+                    if first_item is None:
+                        first_item = busy
+                    
+                    try:
+                        value = yield item
+                        resume = generator.send
+                    except GeneratorExit:
+                        generator.close()
+                        raise
+                    except BaseException as e:
+                        resume, value = generator.throw, e
             except Exception as e:
-                success = False
                 error = str(e)
                 raise
             finally:
-                end_time = time.time()
-                end_memory = self._get_memory_usage()
-                
-                metrics = PerformanceMetrics(
-                    execution_time=end_time - start_time,
-                    memory_usage=end_memory - start_memory,
-                    function_name=func.__name__,
-                    timestamp=end_time,
-                    success=success,
-                    error=error
+                self._finish(
+                    key, func.__name__, sample, busy, error,
+                    first_item=first_item, items=items
                 )
-                
-                self._log_metrics(metrics)
+        return wrapper
+    
+    def _wrap_async_generator(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap an async generator function, timing time spent producing items."""
+        calls = itertools.count()
+        key = self._stats_key(func)
+        
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            sample, _ = self._start(calls)
+            error = None
+            busy = 0
+            items = 0
+            first_item = None
             
-            return result
-        return wrapper  # type: ignore
+            try:
+                generator = func(*args, **kwargs)
+                resume, value = generator.asend, None
+                while True:
+                    resumed = time.perf_counter_ns()
+                    try:
+                        item = await resume(value)
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        busy += time.perf_counter_ns() - resumed
+                    
+                    items += 1
+                    if first_item is None:
+                        first_item = busy
+                    
+                    try:
+                        value = yield item
+                        resume = generator.asend
+                    except GeneratorExit:
+                        await generator.aclose()
+                        raise
+                    except BaseException as e:
+                        resume, value = generator.athrow, e
+            except Exception as e:
+                error = str(e)
+                raise
+            finally:
+                self._finish(
+                    key, func.__name__, sample, busy, error,
+                    first_item=first_item, items=items
+                )
+        return wrapper
     
-    def _get_memory_usage(self) -> float:
-        """Get current memory usage."""
+    def _start(self, calls: Iterator[int]) -> Tuple[Optional['_Sample'], int]:
+        """Begin a measurement.
+        
+        Args:
+            calls: Call counter of the measured function, so each function
+                has one in every ``sample_rate`` of its own calls sampled
+        
+        Returns:
+            Tuple of (sample baseline or None if not sampled, start time in ns)
+        """
+        sample = None
+        if next(calls) % self.sample_rate == 0:
+            sample = _Sample(self._get_memory_usage() if self.track_memory else 0.0)
+            if self.profile_memory:
+                self._take_snapshot(sample)
+        return sample, time.perf_counter_ns()
+    
+    def _finish(
+        self,
+        key: str,
+        function_name: str,
+        sample: Optional['_Sample'],
+        elapsed: int,
+        error: Optional[str],
+        first_item: Optional[int] = None,
+        items: Optional[int] = None
+    ) -> None:
+        """Complete a measurement and record it if required.
+        
+        Args:
+            key: Aggregate key of the measured function
+            function_name: Name of the measured function, as logged
+            sample: Baseline taken at the start of a sampled call
+            elapsed: Measured execution time in ns
+            error: Error message if the call failed
+            first_item: Time to the first produced item in ns (streams only)
+            items: Number of produced items (streams only)
+        """
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats.setdefault(key, FunctionStats())
+        stats.record(elapsed, error is None)
+        self._unflushed = True
+        
+        if (self.flush_interval is not None
+                and time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush_stats()
+        
+        execution_time = elapsed / 1e9
+        if not (sample or error is not None or execution_time > self.slow_threshold):
+            return
+        
+        memory_usage = 0.0
+        if sample and self.track_memory:
+            memory_usage = self._get_memory_usage() - sample.memory
+        
+        metrics = PerformanceMetrics(
+            execution_time=execution_time,
+            memory_usage=memory_usage,
+            function_name=function_name,
+            timestamp=time.time(),
+            success=error is None,
+            error=error,
+            first_item_time=first_item / 1e9 if first_item is not None else None,
+            items=items
+        )
+        if sample and sample.snapshot is not None:
+            self._profile_memory(metrics, sample)
+        self._log_metrics(metrics)
+    
+    def _take_snapshot(self, sample: _Sample) -> None:
+        """Record a tracemalloc baseline on a sample, starting tracing if needed."""
+        import tracemalloc
+        
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.memory_frames)
+            self._started_tracemalloc = True
+        sample.snapshot = tracemalloc.take_snapshot()
+        with _samples_lock:
+            if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+                peak = tracemalloc.get_traced_memory()[1]
+                for other in _open_samples:
+                    other.peak = max(other.peak, peak)
+                tracemalloc.reset_peak()
+            sample.traced = tracemalloc.get_traced_memory()[0]
+            _open_samples.add(sample)
+    
+    def _profile_memory(self, metrics: PerformanceMetrics, sample: _Sample) -> None:
+        """Diff allocations against the start of the call and write a report."""
+        import tracemalloc
+        
+        with _samples_lock:
+            _open_samples.discard(sample)
+            if not tracemalloc.is_tracing():
+                return
+            peak = max(sample.peak, tracemalloc.get_traced_memory()[1])
+        
+        # Keep the profiler's own bookkeeping out of the report
+        filters = [
+            tracemalloc.Filter(False, pattern)
+            for pattern in (tracemalloc.__file__, __file__, '<frozen importlib._bootstrap*>')
+        ]
+        snapshot = tracemalloc.take_snapshot().filter_traces(filters)
+        start_snapshot = sample.snapshot.filter_traces(filters)
+        
+        key = 'traceback' if self.memory_frames > 1 else 'lineno'
+        top = [
+            stat for stat in snapshot.compare_to(start_snapshot, key)
+            if stat.size_diff > 0
+        ][:self.memory_top]
+        
+        metrics.peak_memory = max(peak - sample.traced, 0) / 1024 / 1024
+        metrics.top_allocations = [
+            f"{stat.size_diff / 1024:+.1f}KB ({stat.count_diff:+d} blocks) "
+            + " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in stat.traceback)
+            for stat in top
+        ]
+        self._write_memory_report(metrics)
+    
+    def _write_memory_report(self, metrics: PerformanceMetrics) -> None:
+        """Append a memory profile to memory_profile.log in the log directory."""
+        lines = [
+            f"=== {datetime.datetime.fromtimestamp(metrics.timestamp).isoformat()} "
+            f"{metrics.function_name} ({metrics.execution_time:.3f}s) ===",
+            f"Peak above start: {metrics.peak_memory:.2f}MB",
+            "Top allocation sites since start:",
+        ]
+        lines.extend(f"  {line}" for line in metrics.top_allocations or ["(none)"])
+        
+        with _report_lock:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.log_dir / 'memory_profile.log', 'a') as f:
+                f.write("\n".join(lines) + "\n\n")
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get aggregate statistics for every measured function.
+        
+        Returns:
+            Mapping of qualified function name (``module.qualname``) to
+            count, errors, total/mean/min/max and p50/p90/p99 latency in
+            seconds
+        """
+        return {
+            name: stats.to_dict()
+            for name, stats in list(self._stats.items())
+        }
+    
+    def flush_stats(self) -> None:
+        """Write a compact snapshot of all aggregates to the log."""
+        import json
+        
+        self._last_flush = time.monotonic()
+        self._unflushed = False
+        snapshot = self.get_stats()
+        if snapshot:
+            self._ensure_handler()
+            self.logger.info(f"Snapshot: {json.dumps(snapshot, separators=(',', ':'))}")
+    
+    def close(self) -> None:
+        """Flush aggregates and pending log records and detach the handler.
+        
+        Aggregates are only written if they changed since the last flush.
+        """
+        if self._unflushed:
+            self.flush_stats()
+        self._detach_handler()
+        if self._started_tracemalloc:
+            import tracemalloc
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+    
+    def reset_stats(self) -> None:
+        """Discard all aggregate statistics."""
+        self._stats = {}
+    
+    @staticmethod
+    def _get_process() -> Any:
+        """Get a reusable handle on the current process."""
         try:
             import psutil
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024  # MB
+            return psutil.Process()
         except ImportError:
+            return None
+    
+    def _get_memory_usage(self) -> float:
+        """Get current memory usage."""
+        pid = os.getpid()
+        if self._process is _UNRESOLVED or self._process_pid != pid:
+            # The handle is bound to a PID, so a forked child needs its own
+            self._process = self._get_process()
+            self._process_pid = pid
+        if self._process is None:
             return 0.0
+        return self._process.memory_info().rss / 1024 / 1024  # MB
     
     def _log_metrics(self, metrics: PerformanceMetrics) -> None:
         """Log performance metrics."""
+        self._ensure_handler()
         message = (
             f"Function: {metrics.function_name} | "
             f"Time: {metrics.execution_time:.3f}s | "
@@ -107,17 +823,65 @@ def _log_metrics(self, metrics: PerformanceMetrics) -> None:
             f"Success: {metrics.success}"
         )
         
+        if metrics.peak_memory is not None:
+            message += f" | Peak: {metrics.peak_memory:.2f}MB"
+        
+        if metrics.items is not None:
+            message += f" | Items: {metrics.items}"
+            if metrics.first_item_time is not None:
+                message += f" | First item: {metrics.first_item_time:.3f}s"
+            if metrics.execution_time > 0:
+                message += f" | Throughput: {metrics.items / metrics.execution_time:.1f}/s"
+        
         if metrics.error:
             message += f" | Error: {metrics.error}"
         
-        if metrics.execution_time > 1.0:  # Slow execution warning
+        if metrics.execution_time > self.slow_threshold:  # Slow execution warning
             self.logger.warning(f"Slow execution detected: {message}")
         else:
             self.logger.info(message)
 
-# Global performance monitor instance
-monitor = PerformanceMonitor(Path("logs"))
+# Global performance monitor, created on first use
+_monitor: Optional[PerformanceMonitor] = None
+_monitor_lock = threading.Lock()
+
+def get_monitor() -> PerformanceMonitor:
+    """Get the global performance monitor, creating it if necessary."""
+    global _monitor
+    if _monitor is None:
+        with _monitor_lock:
+            if _monitor is None:
+                _monitor = PerformanceMonitor(Path("logs"))
+    return _monitor
+
+def configure_monitor(config: Optional['ProbeConfig'] = None, **settings: Any) -> PerformanceMonitor:
+    """Configure the global performance monitor.
+    
+    Args:
+        config: ProbeConfig whose ``performance`` section provides the
+            settings; a relative ``log_dir`` is resolved against its base
+            directory
+        **settings: PerformanceMonitor settings, overriding the config
+        
+    Returns:
+        The configured global monitor
+    """
+    if config is not None:
+        options = dict(config.performance_settings)
+        if 'log_dir' in options:
+            options['log_dir'] = config.base_dir / options['log_dir']
+        settings = {**options, **settings}
+    
+    monitor = get_monitor()
+    monitor.configure(**settings)
+    return monitor
+
+def __getattr__(name: str) -> Any:
+    """Resolve the global ``monitor`` lazily."""
+    if name == 'monitor':
+        return get_monitor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def measure_performance(func: F) -> F:
     """Convenience decorator for performance monitoring."""
-    return monitor.measure(func)
+    return get_monitor().measure(func)
@@ -0,0 +1,227 @@
+"""Hierarchical span tracing for Cultural Probes.
+
+Spans are only recorded while a Tracer is active, so instrumented code
+costs next to nothing when tracing is off. Parent/child relationships
+follow ``contextvars`` and can be carried into thread and process pools
+with ``Tracer.submit`` or ``propagate``. Recorded spans are exported in
+the Chrome trace event format, which chrome://tracing, Perfetto and
+speedscope render as a timeline or flamegraph.
+"""
+
+import contextlib
+import contextvars
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+class SpanContext(NamedTuple):
+    """Picklable reference to a span, used as the parent of new spans."""
+    trace_id: str
+    span_id: str
+
+# Tracer receiving spans and the innermost open span in this context
+_active_tracer: contextvars.ContextVar[Optional['Tracer']] = contextvars.ContextVar(
+    'active_tracer', default=None
+)
+_current_span: contextvars.ContextVar[Optional[SpanContext]] = contextvars.ContextVar(
+    'current_span', default=None
+)
+
+class Tracer:
+    """Collects spans and exports them as a Chrome trace."""
+    
+    def __init__(self, trace_id: Optional[str] = None):
+        """Initialize tracer.
+        
+        Args:
+            trace_id: Identifier shared by all spans of this trace
+        """
+        self.trace_id = trace_id or os.urandom(8).hex()
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._id_prefix = f"{os.getpid()}-{os.urandom(2).hex()}"
+    
+    @contextlib.contextmanager
+    def activate(self, parent: Optional[SpanContext] = None) -> Iterator['Tracer']:
+        """Record spans opened in this context into this tracer.
+        
+        Args:
+            parent: Span to attach new root spans to, e.g. one received
+                from another process
+        """
+        tracer_token = _active_tracer.set(self)
+        span_token = _current_span.set(parent)
+        try:
+            yield self
+        finally:
+            _current_span.reset(span_token)
+            _active_tracer.reset(tracer_token)
+    
+    def _next_span_id(self) -> str:
+        """Get a span ID that is unique across processes."""
+        return f"{self._id_prefix}-{next(self._ids)}"
+    
+    def _record(self, event: Dict[str, Any]) -> None:
+        """Store a finished span event."""
+        with self._lock:
+            self._events.append(event)
+    
+    def merge(self, events: List[Dict[str, Any]]) -> None:
+        """Add span events recorded by another tracer."""
+        with self._lock:
+            self._events.extend(events)
+    
+    def events(self) -> List[Dict[str, Any]]:
+        """Get all recorded span events, ordered by start time."""
+        with self._lock:
+            return sorted(self._events, key=lambda event: event['ts'])
+    
+    def submit(self, executor: 'Executor', fn: Callable[..., Any], *args: Any, **kwargs: Any) -> 'Future':
+        """Submit a call to an executor with the current span as parent.
+        
+        Thread pools run the call in a copy of the current context. For
+        process pools the call runs under a fresh tracer in the worker and
+        its spans are merged back here when the result arrives.
+        
+        Returns:
+            Future resolving to the call's result
+        """
+        # Imported here: loading the process pool pulls in multiprocessing
+        from concurrent.futures import Future, ProcessPoolExecutor
+        
+        if not isinstance(executor, ProcessPoolExecutor):
+            return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+        
+        remote = executor.submit(
+            _run_traced, self.trace_id, _current_span.get(), fn, args, kwargs
+        )
+        result: 'Future' = Future()
+        
+        def _merge(done: 'Future') -> None:
+            try:
+                value, events = done.result()
+            except BaseException as e:
+                result.set_exception(e)
+            else:
+                self.merge(events)
+                result.set_result(value)
+        
+        remote.add_done_callback(_merge)
+        return result
+    
+    def export_chrome_trace(self, path: Path) -> Path:
+        """Write recorded spans as a Chrome trace JSON file.
+        
+        Args:
+            path: Output file
+        
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        with open(path, 'w') as f:
+            json.dump({
+                'traceEvents': self.events(),
+                'displayTimeUnit': 'ms',
+                'otherData': {'trace_id': self.trace_id},
+            }, f)
+        return path
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[SpanContext]]:
+    """Trace a block of code as a child of the current span.
+    
+    Does nothing unless a tracer is active.
+    
+    Args:
+        name: Span name
+        **attributes: Extra values stored with the span
+    """
+    tracer = _active_tracer.get()
+    if tracer is None:
+        yield None
+        return
+    
+    parent = _current_span.get()
+    context = SpanContext(tracer.trace_id, tracer._next_span_id())
+    token = _current_span.set(context)
+    timestamp = time.time_ns()
+    start = time.perf_counter_ns()
+    error = None
+    try:
+        yield context
+    except BaseException as e:
+        error = repr(e)
+        raise
+    finally:
+        duration = time.perf_counter_ns() - start
+        _current_span.reset(token)
+        args = {
+            'span_id': context.span_id,
+            'parent_id': parent.span_id if parent else None,
+            **attributes,
+        }
+        if error is not None:
+            args['error'] = error
+        tracer._record({
+            'name': name,
+            'cat': 'span',
+            'ph': 'X',
+            'ts': timestamp / 1000,
+            'dur': duration / 1000,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': args,
+        })
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator tracing each call of a function as a span.
+    
+    Args:
+        name: Span name, defaults to the function's qualified name
+    """
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore
+    return decorator
+
+def current_context() -> Optional[SpanContext]:
+    """Get the innermost open span, e.g. to hand to another process."""
+    return _current_span.get()
+
+def propagate(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Bind a callable to the current context for use in another thread."""
+    return functools.partial(contextvars.copy_context().run, fn)
+
+def _run_traced(
+    trace_id: str,
+    parent: Optional[SpanContext],
+    fn: Callable[..., Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any]
+) -> Tuple[Any, List[Dict[str, Any]]]:
+    """Run a call in a worker process under a fresh tracer.
+    
+    Returns:
+        Tuple of (call result, recorded span events)
+    """
+    tracer = Tracer(trace_id)
+    with tracer.activate(parent):
+        value = fn(*args, **kwargs)
+    return value, tracer.events()
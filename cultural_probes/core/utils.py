@@ -1,60 +1,325 @@
 """Utility functions for Cultural Probes."""
 
+import contextlib
+import functools
 import hashlib
+import os
 import platform
 import datetime
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any
+from typing import IO, Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
 
-def calculate_checksum(file_path: Path) -> str:
+def calculate_checksum(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
     """Calculate SHA-256 checksum of a file.
     
     Args:
         file_path: Path to file
+        chunk_size: Bytes read per block; large blocks let hashing run
+            without the GIL, so checksums parallelize across threads
         
     Returns:
         Hexadecimal checksum string
     """
     sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
+        for byte_block in iter(lambda: f.read(chunk_size), b""):
             sha256_hash.update(byte_block)
     return sha256_hash.hexdigest()
 
-def get_system_info() -> Dict[str, str]:
-    """Collect system information.
+@functools.lru_cache(maxsize=None)
+def _static_system_info() -> Dict[str, str]:
+    """Probe the platform once per process.
     
-    Returns:
-        Dictionary of system information
+    Some ``platform`` calls shell out or read ``/proc`` on first use, and
+    none of these values change while the process runs.
     """
     return {
         "os": platform.system(),
         "os_version": platform.version(),
         "machine": platform.machine(),
         "python_version": platform.python_version(),
-        "timestamp": datetime.datetime.now().isoformat()
     }
 
-def generate_submission_id() -> str:
+def get_system_info() -> Dict[str, str]:
+    """Collect system information.
+    
+    Returns:
+        Dictionary of system information with a fresh timestamp
+    """
+    info = dict(_static_system_info())
+    info["timestamp"] = datetime.datetime.now().isoformat()
+    return info
+
+# Crockford base32 alphabet, as used by ULIDs
+_ID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ID_LENGTH = 26
+_RANDOM_BITS = 80
+
+@contextlib.contextmanager
+def _locked_file(path: Path) -> Iterator[IO[str]]:
+    """Open a file for reading and writing under an exclusive lock."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    with os.fdopen(fd, "r+") as f:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield f
+        finally:
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+class SubmissionIdAllocator:
+    """Allocates unique, monotonic and time-sortable submission IDs.
+    
+    IDs are ULIDs: a 48-bit millisecond timestamp followed by 80 random
+    bits, written as 26 Crockford base32 characters, so they sort by
+    creation time. If a new ID would not be greater than the last one
+    (same millisecond or clock moving backwards), the last ID is
+    incremented instead. With a state file, the last ID is shared by all
+    processes using that file under an exclusive lock.
+    """
+    
+    def __init__(self, state_file: Optional[Path] = None):
+        """Initialize allocator.
+        
+        Args:
+            state_file: File holding the last issued ID, for uniqueness
+                across processes
+        """
+        self.state_file = Path(state_file) if state_file else None
+        self._lock = threading.Lock()
+        self._last = 0
+    
+    @staticmethod
+    def _encode(value: int) -> str:
+        """Encode a 128-bit value as a ULID string."""
+        chars = []
+        for _ in range(_ID_LENGTH):
+            value, index = divmod(value, 32)
+            chars.append(_ID_ALPHABET[index])
+        return "".join(reversed(chars))
+    
+    @staticmethod
+    def _decode(text: str) -> int:
+        """Decode a ULID string, returning 0 if it is invalid."""
+        value = 0
+        for char in text.upper():
+            index = _ID_ALPHABET.find(char)
+            if index < 0:
+                return 0
+            value = value * 32 + index
+        return value
+    
+    @staticmethod
+    def _next(last: int) -> int:
+        """Get the next ID value after ``last``."""
+        candidate = (time.time_ns() // 1_000_000) << _RANDOM_BITS | secrets.randbits(_RANDOM_BITS)
+        return candidate if candidate > last else last + 1
+    
+    def allocate(self) -> str:
+        """Allocate a new submission ID.
+        
+        Returns:
+            26-character ULID string
+        """
+        with self._lock:
+            if self.state_file is None:
+                self._last = self._next(self._last)
+                return self._encode(self._last)
+            
+            with _locked_file(self.state_file) as f:
+                last = max(self._last, self._decode(f.read().strip()))
+                self._last = self._next(last)
+                f.seek(0)
+                f.truncate()
+                f.write(self._encode(self._last))
+                f.flush()
+            return self._encode(self._last)
+
+# Allocators by state file, so IDs stay monotonic within a process
+_allocators: Dict[Optional[Path], SubmissionIdAllocator] = {}
+_allocators_lock = threading.Lock()
+
+def generate_submission_id(state_file: Optional[Path] = None) -> str:
     """Generate a unique submission ID.
     
+    Args:
+        state_file: Optional file shared by processes allocating IDs for
+            the same submissions directory
+        
+    Returns:
+        Monotonic, time-sortable ULID string
+    """
+    key = Path(state_file).resolve() if state_file else None
+    allocator = _allocators.get(key)
+    if allocator is None:
+        with _allocators_lock:
+            allocator = _allocators.setdefault(key, SubmissionIdAllocator(key))
+    return allocator.allocate()
+
+@dataclass
+class RetentionReport:
+    """Outcome of a retention cleanup run."""
+    scanned: int = 0
+    scanned_bytes: int = 0
+    deleted: List[Path] = field(default_factory=list)
+    bytes_reclaimed: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+    dry_run: bool = False
+    
+    @property
+    def kept(self) -> int:
+        """Number of scanned files that were not deleted."""
+        return self.scanned - len(self.deleted)
+
+def _scan_files(
+    directory: Path,
+    recursive: bool,
+    errors: Dict[str, str]
+) -> Iterator[Tuple[str, int, float]]:
+    """Yield (path, size, mtime) for regular files below a directory.
+    
+    A missing top-level directory yields nothing; other unreadable
+    directories and files are recorded in ``errors`` and skipped.
+    """
+    root = str(directory)
+    pending = [root]
+    while pending:
+        current = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except FileNotFoundError:
+            if current != root:
+                errors[current] = "Directory disappeared during scan"
+            continue
+        except OSError as e:
+            errors[current] = str(e)
+            continue
+        
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        info = entry.stat(follow_symlinks=False)
+                        yield entry.path, info.st_size, info.st_mtime
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                except OSError as e:
+                    errors[entry.path] = str(e)
+
+def _delete_batch(batch: List[Tuple[str, int]]) -> Tuple[List[Tuple[str, int]], Dict[str, str]]:
+    """Delete a batch of files.
+    
     Returns:
-        Formatted timestamp-based ID
+        Tuple of (deleted (path, size) pairs, errors by path)
     """
-    return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    deleted = []
+    errors = {}
+    for path, size in batch:
+        try:
+            os.unlink(path)
+            deleted.append((path, size))
+        except OSError as e:
+            errors[path] = str(e)
+    return deleted, errors
 
-def clean_old_submissions(directory: Path, max_age_days: int = 30) -> None:
+def clean_old_submissions(
+    directory: Path,
+    max_age_days: Optional[float] = 30,
+    max_total_bytes: Optional[int] = None,
+    recursive: bool = False,
+    dry_run: bool = False,
+    max_workers: Optional[int] = None,
+    batch_size: int = 256
+) -> RetentionReport:
     """Clean up old submission files.
     
+    Files older than ``max_age_days`` are removed first. If the remaining
+    files still exceed ``max_total_bytes``, the least recently modified
+    ones are removed until the directory fits the budget. Deletions run
+    in batches across a thread pool.
+    
     Args:
         directory: Directory containing submissions
-        max_age_days: Maximum age of files to keep
+        max_age_days: Maximum age of files to keep, or None for no age limit
+        max_total_bytes: Total size budget for kept files, or None
+        recursive: Also clean subdirectories
+        dry_run: Only report what would be deleted
+        max_workers: Deletion threads (default: ThreadPoolExecutor default)
+        batch_size: Files deleted per task
+    
+    Returns:
+        Report of scanned, deleted and reclaimed bytes
     """
-    cutoff = datetime.datetime.now() - datetime.timedelta(days=max_age_days)
+    report = RetentionReport(dry_run=dry_run)
+    cutoff = None
+    if max_age_days is not None:
+        cutoff = (datetime.datetime.now() - datetime.timedelta(days=max_age_days)).timestamp()
+    
+    expired = []
+    kept = []
+    for path, size, mtime in _scan_files(Path(directory), recursive, report.errors):
+        report.scanned += 1
+        report.scanned_bytes += size
+        if cutoff is not None and mtime < cutoff:
+            expired.append((path, size))
+        else:
+            kept.append((mtime, path, size))
+    
+    if max_total_bytes is not None:
+        remaining = sum(size for _, _, size in kept)
+        kept.sort()
+        for _, path, size in kept:
+            if remaining <= max_total_bytes:
+                break
+            expired.append((path, size))
+            remaining -= size
     
-    for item in directory.glob("*"):
-        if item.is_file() and item.stat().st_mtime < cutoff.timestamp():
-            item.unlink()
+    if dry_run:
+        report.deleted = [Path(path) for path, _ in expired]
+        report.bytes_reclaimed = sum(size for _, size in expired)
+        return report
+    
+    import concurrent.futures
+    
+    batches = [expired[i:i + batch_size] for i in range(0, len(expired), batch_size)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for deleted, errors in executor.map(_delete_batch, batches):
+            report.deleted.extend(Path(path) for path, _ in deleted)
+            report.bytes_reclaimed += sum(size for _, size in deleted)
+            report.errors.update(errors)
+    
+    return report
+
+# Characters that are unsafe in filenames on common platforms
+_UNSAFE_FILENAME_CHARS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+_MAX_FILENAME_BYTES = 255
+
+def _truncate_filename(filename: str, max_bytes: int = _MAX_FILENAME_BYTES) -> str:
+    """Truncate a filename to ``max_bytes`` of UTF-8, keeping its extension."""
+    encoded = filename.encode('utf-8')
+    if len(encoded) <= max_bytes:
+        return filename
+    
+    name, ext = os.path.splitext(filename)
+    ext_bytes = ext.encode('utf-8')
+    if len(ext_bytes) >= max_bytes:
+        name, ext_bytes = filename, b''
+    budget = max_bytes - len(ext_bytes)
+    # Dropping a partial trailing character keeps the result valid UTF-8
+    name = name.encode('utf-8')[:budget].decode('utf-8', errors='ignore')
+    return name + ext_bytes.decode('utf-8')
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize a filename for safe filesystem usage.
@@ -65,15 +330,34 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Replace unsafe characters
-    unsafe_chars = '<>:"/\\|?*'
-    for char in unsafe_chars:
-        filename = filename.replace(char, '_')
-    
-    # Ensure reasonable length
-    max_length = 255
-    if len(filename) > max_length:
-        name, ext = os.path.splitext(filename)
-        filename = name[:max_length-len(ext)] + ext
-    
-    return filename
+    return _truncate_filename(filename.translate(_UNSAFE_FILENAME_CHARS))
+
+def sanitize_filenames(filenames: Iterable[str]) -> List[str]:
+    """Sanitize a batch of filenames in one pass.
+    
+    Names that would collide after sanitizing get a numeric suffix
+    (``name_1.ext``), so every result in the batch is unique. Names are
+    compared case-insensitively, as on macOS and Windows file systems;
+    the original casing is kept.
+    
+    Args:
+        filenames: Original filenames
+        
+    Returns:
+        Sanitized filenames, in input order
+    """
+    seen: Set[str] = set()
+    results = []
+    for filename in filenames:
+        candidate = sanitize_filename(filename)
+        if candidate.casefold() in seen:
+            name, ext = os.path.splitext(candidate)
+            counter = 1
+            while candidate.casefold() in seen:
+                suffix = f"_{counter}{ext}"
+                budget = _MAX_FILENAME_BYTES - len(suffix.encode('utf-8'))
+                candidate = _truncate_filename(name, budget) + suffix
+                counter += 1
+        seen.add(candidate.casefold())
+        results.append(candidate)
+    return results
@@ -0,0 +1,16 @@
+"""Submission packaging for Cultural Probes.
+
+Creates the ZIP archive and PDF report participants send to the research
+team. The PDF toolkit is only imported when a PDF is requested.
+"""
+
+from typing import Any
+
+__all__ = ['ProbeSubmission', 'SubmissionResult']
+
+def __getattr__(name: str) -> Any:
+    """Import the submission API on first use, keeping CLI start-up cheap."""
+    if name in __all__:
+        from . import submitter
+        return getattr(submitter, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,97 @@
+"""Command line interface for creating probe submissions."""
+
+import argparse
+from typing import List, Optional
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point for the probe-submit command.
+    
+    Args:
+        argv: Command line arguments (default: sys.argv)
+        
+    Returns:
+        Process exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog='probe-submit',
+        description='Package your probe responses for submission.'
+    )
+    parser.add_argument(
+        '--config', default='probe_config.yaml',
+        help='Path to probe_config.yaml (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--no-pdf', action='store_true',
+        help='Only create the ZIP archive, skipping the PDF report'
+    )
+    args = parser.parse_args(argv)
+    
+    from .submitter import ProbeSubmission
+    
+    print("Starting Cultural Probe submission process...")
+    
+    submission = ProbeSubmission(args.config)
+    if submission.submit(pdf=not args.no_pdf):
+        print("\nThank you for participating in our study! 🙏")
+        return 0
+    
+    print("\n❌ Submission failed. Please try again or contact support.")
+    return 1
+
+def verify_main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point for the probe-verify command.
+    
+    Args:
+        argv: Command line arguments (default: sys.argv)
+        
+    Returns:
+        Process exit status, non-zero if any submission failed verification
+    """
+    parser = argparse.ArgumentParser(
+        prog='probe-verify',
+        description='Verify received probe submissions.'
+    )
+    parser.add_argument(
+        'paths', nargs='+',
+        help='Submission ZIP files or directories containing them'
+    )
+    parser.add_argument(
+        '--checksums',
+        help='sha256sum-style file of expected checksums (default: per-archive .sha256 files)'
+    )
+    parser.add_argument(
+        '--report',
+        help='Write a report; .json for JSON, anything else for CSV'
+    )
+    parser.add_argument(
+        '--workers', type=int,
+        help='Number of verification threads'
+    )
+    args = parser.parse_args(argv)
+    
+    from .verify import read_checksum_file, verify_submissions, write_report
+    
+    checksums = read_checksum_file(args.checksums) if args.checksums else None
+    results = verify_submissions(args.paths, checksums, args.workers)
+    
+    for result in results:
+        if result.ok:
+            status = '✅' if result.checksum_ok else '⚠️  (no checksum recorded)'
+            print(f"{status} {result.path.name}")
+            continue
+        print(f"❌ {result.path.name}")
+        if result.checksum_ok is False:
+            print(f"   Checksum mismatch: expected {result.expected_checksum}, got {result.checksum}")
+        for name in result.missing_files:
+            print(f"   Missing file: {name}")
+        for name in result.unexpected_files:
+            print(f"   Unexpected file: {name}")
+        for error in result.errors:
+            print(f"   {error}")
+    
+    failed = sum(not result.ok for result in results)
+    print(f"\n{len(results) - failed}/{len(results)} submissions verified")
+    if args.report:
+        print(f"📁 Report written to: {write_report(results, args.report)}")
+    
+    return 1 if failed or not results else 0
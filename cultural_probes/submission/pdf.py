@@ -0,0 +1,186 @@
+"""PDF report generation for Cultural Probe submissions.
+
+This module pulls in ReportLab, markdown and pyqrcode, so it is only
+imported when a PDF is actually requested.
+"""
+
+import datetime
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import markdown
+import pyqrcode
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import (
+    SimpleDocTemplate, Paragraph, Spacer, Image, 
+    PageBreak, Table, TableStyle, Flowable, Preformatted
+)
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib.enums import TA_CENTER
+
+from ..core.tracing import span
+
+if TYPE_CHECKING:
+    from .submitter import ProbeSubmission
+
+class Watermark(Flowable):
+    """Adds a watermark to PDF pages."""
+    def __init__(self, text):
+        Flowable.__init__(self)
+        self.text = text
+    
+    def draw(self):
+        canvas = self.canv
+        canvas.saveState()
+        canvas.setFont('Helvetica', 70)
+        canvas.setFillColor(colors.lightgrey)
+        canvas.setFillAlpha(0.3)
+        canvas.translate(letter[0]/2, letter[1]/2)
+        canvas.rotate(45)
+        canvas.drawCentredString(0, 0, self.text)
+        canvas.restoreState()
+
+def generate_qr_code(data: str) -> str:
+    """Generate QR code for submission verification."""
+    with span('qr_code'):
+        qr = pyqrcode.create(data)
+        temp_path = tempfile.mktemp(suffix='.png')
+        qr.png(temp_path, scale=5)
+        return temp_path
+
+def create_submission_pdf(submission: 'ProbeSubmission', pdf_path: Path) -> Path:
+    """Create a comprehensive PDF report of all probe responses.
+    
+    Args:
+        submission: Submission whose responses and metadata to render
+        pdf_path: Output file
+    
+    Returns:
+        Path of the written PDF
+    """
+    # Create PDF document
+    doc = SimpleDocTemplate(
+        str(pdf_path),
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72
+    )
+    
+    # Get styles
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    heading_style = styles['Heading2']
+    normal_style = styles['Normal']
+    
+    # Create document content
+    content = []
+    
+    # Add watermark if enabled
+    if submission.config['submission_settings']['pdf_settings']['watermark']:
+        content.append(Watermark(submission.config['submission_settings']['pdf_settings']['watermark']))
+    
+    # Add cover page if enabled
+    if submission.config['submission_settings']['pdf_settings']['include_cover_page']:
+        content.append(Paragraph(submission.config['submission_settings']['metadata']['research_project'], title_style))
+        content.append(Spacer(1, 0.5*inch))
+        
+        # Add institution info
+        content.append(Paragraph(submission.config['submission_settings']['metadata']['institution'], heading_style))
+        content.append(Spacer(1, 0.25*inch))
+        
+        # Add submission details table
+        submission_data = [
+            ['Submission ID:', submission.submission_id],
+            ['Timestamp:', datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+            ['Number of Responses:', str(len(list(submission.response_dir.glob('*.md'))))],
+        ]
+        
+        if submission.checksum:
+            submission_data.append(['Checksum:', submission.checksum])
+        
+        table = Table(submission_data, colWidths=[2*inch, 4*inch])
+        table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+            ('PADDING', (0, 0), (-1, -1), 6),
+        ]))
+        content.append(table)
+        
+        # Add QR code if enabled
+        if submission.config['submission_settings']['submission_format']['generate_qr']:
+            qr_data = f"ID:{submission.submission_id}\nChecksum:{submission.checksum or 'N/A'}"
+            qr_path = generate_qr_code(qr_data)
+            content.append(Spacer(1, 0.5*inch))
+            content.append(Image(qr_path, width=2*inch, height=2*inch))
+        
+        # Add data handling notice
+        content.append(Spacer(1, inch))
+        content.append(Paragraph(
+            submission.config['submission_settings']['metadata']['data_handling_notice'],
+            normal_style
+        ))
+        
+        content.append(PageBreak())
+    
+    # Add responses
+    content.append(Paragraph("Probe Responses", heading_style))
+    content.append(Spacer(1, 0.25*inch))
+    
+    for response_file in sorted(submission.response_dir.glob('*.md')):
+        if response_file.is_file():
+            with open(response_file, 'r') as f:
+                md_content = f.read()
+            
+            content.append(Paragraph(response_file.name, heading_style))
+            content.append(Spacer(1, 0.1*inch))
+            
+            # Convert markdown to HTML and add content
+            with span('markdown', file=response_file.name):
+                html_content = markdown.markdown(md_content)
+            content.append(Paragraph(html_content, normal_style))
+            content.append(Spacer(1, 0.5*inch))
+    
+    # Add footer
+    content.append(Spacer(1, inch))
+    footer_style = ParagraphStyle(
+        'Footer',
+        parent=styles['Normal'],
+        fontSize=10,
+        alignment=TA_CENTER,
+        textColor=colors.grey
+    )
+    
+    # Add contact information
+    content.append(Paragraph(
+        f"Contact: {submission.config['submission_settings']['metadata']['contact_info']}",
+        footer_style
+    ))
+    
+    # Generate email template
+    email_template = submission.config['email_template'].format(
+        submission_id=submission.submission_id,
+        timestamp=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        num_responses=len(list(submission.response_dir.glob('*.md'))),
+        checksum=submission.checksum or 'N/A',
+        participant_name="[Your Name]"
+    )
+    
+    content.append(Spacer(1, 0.5*inch))
+    content.append(Paragraph("Email Template:", heading_style))
+    content.append(Preformatted(email_template, styles['Code']))
+    
+    # Build PDF
+    with span('pdf_build'):
+        doc.build(content)
+    return pdf_path
@@ -0,0 +1,180 @@
+"""Submission packaging for Cultural Probes."""
+
+import contextlib
+import datetime
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from ..core.config import ProbeConfig
+from ..core.tracing import Tracer, span, traced
+from ..core.utils import calculate_checksum, generate_submission_id, get_system_info
+
+@dataclass
+class SubmissionResult:
+    """Files produced by a submission."""
+    submission_id: str
+    zip_path: Path
+    checksum: Optional[str] = None
+    checksum_path: Optional[Path] = None
+    pdf_path: Optional[Path] = None
+    trace_path: Optional[Path] = None
+
+class ProbeSubmission:
+    """Packages probe responses into a ZIP archive and PDF report."""
+    
+    def __init__(self, config: Union[str, Path, ProbeConfig] = "probe_config.yaml"):
+        """Initialize submission handler with configuration.
+        
+        Args:
+            config: ProbeConfig instance or path to the configuration file
+        """
+        self.probe_config = config if isinstance(config, ProbeConfig) else ProbeConfig(str(config))
+        self.config: Dict[str, Any] = self.probe_config.config
+        
+        # Directories are resolved (and created) relative to the config file
+        self.response_dir = self.probe_config.get_path('responses')
+        self.output_dir = self.probe_config.get_path('submissions')
+        self.template_dir = self.probe_config.get_path('templates')
+        
+        # Generate a collision-free submission ID, coordinated with other
+        # processes writing to the same submissions directory
+        self.submission_id = generate_submission_id(self.output_dir / '.submission_id')
+        self.checksum: Optional[str] = None
+        self.checksum_path: Optional[Path] = None
+    
+    def _calculate_checksum(self, file_path: Path) -> str:
+        """Calculate SHA-256 checksum of a file."""
+        with span('checksum', file=file_path.name):
+            return calculate_checksum(file_path)
+    
+    def _get_system_info(self) -> Dict[str, str]:
+        """Collect system information."""
+        return get_system_info()
+    
+    @traced()
+    def _create_submission_zip(self, progress: Optional[Callable[[str], None]] = None) -> Path:
+        """Create a ZIP file containing all probe responses."""
+        import json
+        import zipfile
+        
+        from .verify import write_checksum_file
+        
+        zip_path = self.output_dir / f"probe_submission_{self.submission_id}.zip"
+        
+        # Select response files once, so the archive and its metadata agree
+        response_files = [
+            file_path for file_path in self.response_dir.glob('*.md')
+            if file_path.is_file() and not file_path.name.startswith('.')
+        ]
+        if not response_files:
+            raise ValueError("No probe responses found in .probe_responses directory")
+        
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # Add probe responses
+            with span('zip_responses', count=len(response_files)):
+                for file_path in response_files:
+                    if progress:
+                        progress(f"Adding response: {file_path.name}")
+                    zipf.write(file_path, file_path.relative_to(self.response_dir))
+            
+            # Add submission metadata
+            include_system_info = self.config['submission_settings']['submission_format']['include_system_info']
+            metadata = {
+                'submission_id': self.submission_id,
+                'timestamp': datetime.datetime.now().isoformat(),
+                'num_responses': len(response_files),
+                'response_files': [f.name for f in response_files],
+                'system_info': self._get_system_info() if include_system_info else {},
+                'config': self.config
+            }
+            zipf.writestr('submission_metadata.json', json.dumps(metadata, indent=2))
+        
+        # Calculate checksum if enabled
+        if self.config['submission_settings']['security']['generate_checksum']:
+            self.checksum = self._calculate_checksum(zip_path)
+            # Lets the research team verify the archive on receipt
+            self.checksum_path = write_checksum_file(zip_path, self.checksum)
+        
+        return zip_path
+    
+    @traced()
+    def _create_submission_pdf(self, zip_path: Path) -> Path:
+        """Create a comprehensive PDF report of all probe responses."""
+        # ReportLab and friends are only imported when a PDF is requested
+        from .pdf import create_submission_pdf
+        
+        pdf_path = self.output_dir / f"probe_submission_{self.submission_id}.pdf"
+        return create_submission_pdf(self, pdf_path)
+    
+    def create(
+        self,
+        pdf: bool = True,
+        progress: Optional[Callable[[str], None]] = None
+    ) -> SubmissionResult:
+        """Create the submission files.
+        
+        Args:
+            pdf: Also render the PDF report
+            progress: Callback receiving progress messages
+        
+        Returns:
+            Paths and checksum of the created files
+        
+        Raises:
+            ValueError: If there are no probe responses
+        """
+        tracer = None
+        if self.config['submission_settings'].get('trace'):
+            tracer = Tracer(self.submission_id)
+        
+        trace_path = None
+        try:
+            with tracer.activate() if tracer else contextlib.nullcontext():
+                with span('submit', submission_id=self.submission_id):
+                    zip_path = self._create_submission_zip(progress)
+                    result = SubmissionResult(self.submission_id, zip_path, self.checksum, self.checksum_path)
+                    if pdf:
+                        result.pdf_path = self._create_submission_pdf(zip_path)
+        finally:
+            # Export even on failure, the trace shows where it went wrong
+            if tracer:
+                trace_path = tracer.export_chrome_trace(
+                    self.output_dir / f"probe_submission_{self.submission_id}.trace.json"
+                )
+        
+        result.trace_path = trace_path
+        return result
+    
+    def submit(self, pdf: bool = True) -> bool:
+        """Create submission files, reporting progress on the console."""
+        try:
+            print("Creating submission package...")
+            
+            result = self.create(pdf=pdf, progress=lambda message: print(f"   {message}"))
+            print(f"✅ Created response archive: {result.zip_path}")
+            print(f"   Checksum: {result.checksum or 'N/A'}")
+            if result.checksum_path:
+                print(f"   Checksum file: {result.checksum_path}")
+            if result.pdf_path:
+                print(f"✅ Created submission PDF: {result.pdf_path}")
+            if result.trace_path:
+                print(f"🔎 Trace written to: {result.trace_path}")
+            
+            print("\n📤 Submission package created successfully!")
+            print(f"📁 Location: {self.output_dir.absolute()}")
+            print("\n📧 Next Steps:")
+            if result.pdf_path:
+                print("1. Review the generated PDF")
+                print(f"2. Email the PDF to: {self.config['submission_settings']['receiver_email']}")
+                print("3. Keep the ZIP file for your records")
+                print("\nℹ️  The PDF includes a pre-formatted email template you can use.")
+            else:
+                print(f"1. Email the ZIP file to: {self.config['submission_settings']['receiver_email']}")
+                print(f"2. Include the checksum above and submission ID {self.submission_id}")
+            
+            return True
+        
+        except Exception as e:
+            print(f"\n❌ Error during submission: {str(e)}")
+            return False
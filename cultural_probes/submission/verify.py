@@ -0,0 +1,202 @@
+"""Integrity checks for received probe submissions.
+
+Each archive is checked against its recorded SHA-256 checksum, the member
+CRCs stored in the ZIP, and the file list in ``submission_metadata.json``.
+Directories of submissions are verified in parallel; hashing and
+decompression release the GIL, so a thread pool scales with the disk.
+"""
+
+import concurrent.futures
+import csv
+import json
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ..core.utils import calculate_checksum
+
+METADATA_FILE = 'submission_metadata.json'
+CHECKSUM_SUFFIX = '.sha256'
+SUBMISSION_PATTERN = 'probe_submission_*.zip'
+
+REPORT_FIELDS = [
+    'path', 'submission_id', 'ok', 'checksum', 'expected_checksum', 'checksum_ok',
+    'num_responses', 'missing_files', 'unexpected_files', 'errors'
+]
+
+@dataclass
+class VerificationResult:
+    """Outcome of verifying one submission archive."""
+    path: Path
+    submission_id: Optional[str] = None
+    checksum: Optional[str] = None
+    expected_checksum: Optional[str] = None
+    num_responses: Optional[int] = None
+    missing_files: List[str] = field(default_factory=list)
+    unexpected_files: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    
+    @property
+    def checksum_ok(self) -> Optional[bool]:
+        """Whether the checksum matches, or None if none was recorded."""
+        if self.expected_checksum is None or self.checksum is None:
+            return None
+        return self.checksum == self.expected_checksum
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the archive passed every check that could be made."""
+        return (
+            self.checksum_ok is not False
+            and not self.missing_files
+            and not self.unexpected_files
+            and not self.errors
+        )
+    
+    def to_dict(self) -> Dict[str, object]:
+        """Convert to a JSON-serialisable report row."""
+        row = asdict(self)
+        row.update(path=str(self.path), ok=self.ok, checksum_ok=self.checksum_ok)
+        return {name: row[name] for name in REPORT_FIELDS}
+
+def write_checksum_file(zip_path: Path, checksum: str) -> Path:
+    """Write a ``sha256sum``-compatible sidecar next to an archive.
+    
+    Returns:
+        Path of the sidecar file
+    """
+    checksum_path = zip_path.with_name(zip_path.name + CHECKSUM_SUFFIX)
+    checksum_path.write_text(f"{checksum}  {zip_path.name}\n", encoding='utf-8')
+    return checksum_path
+
+def read_checksum_file(checksum_path: Path) -> Dict[str, str]:
+    """Read checksums in ``sha256sum`` format.
+    
+    Args:
+        checksum_path: File with ``<hex digest>  <file name>`` lines
+    
+    Returns:
+        Lower-case checksums by file name
+    """
+    checksums = {}
+    with open(checksum_path, encoding='utf-8') as f:
+        for line in f:
+            digest, _, name = line.strip().partition(' ')
+            if digest and name:
+                # sha256sum marks binary mode with a leading '*'
+                checksums[name.strip().lstrip('*')] = digest.lower()
+    return checksums
+
+def verify_submission(zip_path: Path, expected_checksum: Optional[str] = None) -> VerificationResult:
+    """Verify a single submission archive.
+    
+    Args:
+        zip_path: Submission ZIP file
+        expected_checksum: Known SHA-256 checksum (default: read the
+            ``.sha256`` sidecar, if there is one)
+    
+    Returns:
+        Verification result; problems are recorded on it rather than raised
+    """
+    zip_path = Path(zip_path)
+    result = VerificationResult(zip_path)
+    
+    if expected_checksum is None:
+        sidecar = zip_path.with_name(zip_path.name + CHECKSUM_SUFFIX)
+        if sidecar.exists():
+            expected_checksum = read_checksum_file(sidecar).get(zip_path.name)
+    result.expected_checksum = expected_checksum.lower() if expected_checksum else None
+    
+    try:
+        result.checksum = calculate_checksum(zip_path)
+        
+        with zipfile.ZipFile(zip_path) as zipf:
+            # Reads every member, checking the stored CRCs
+            corrupt = zipf.testzip()
+            if corrupt is not None:
+                result.errors.append(f"Corrupt member: {corrupt}")
+            
+            names = set(zipf.namelist())
+            if METADATA_FILE not in names:
+                result.errors.append(f"Missing {METADATA_FILE}")
+                return result
+            metadata = json.loads(zipf.read(METADATA_FILE))
+    except (OSError, zipfile.BadZipFile, ValueError, RuntimeError, NotImplementedError) as e:
+        # RuntimeError: encrypted member; NotImplementedError: unsupported compression
+        result.errors.append(str(e) or type(e).__name__)
+        return result
+    
+    if not isinstance(metadata, dict):
+        result.errors.append(f"{METADATA_FILE} is not a JSON object")
+        return result
+    
+    result.submission_id = metadata.get('submission_id')
+    response_files = metadata.get('response_files', [])
+    if not isinstance(response_files, list) or not all(isinstance(name, str) for name in response_files):
+        result.errors.append("response_files is not a list of file names")
+        return result
+    result.num_responses = len(response_files)
+    if metadata.get('num_responses') != len(response_files):
+        result.errors.append(
+            f"num_responses is {metadata.get('num_responses')}, "
+            f"but {len(response_files)} response files are listed"
+        )
+    
+    expected = set(response_files)
+    result.missing_files = sorted(expected - names)
+    result.unexpected_files = sorted(names - expected - {METADATA_FILE})
+    return result
+
+def verify_submissions(
+    paths: Iterable[Path],
+    checksums: Optional[Dict[str, str]] = None,
+    max_workers: Optional[int] = None
+) -> List[VerificationResult]:
+    """Verify submission archives in parallel.
+    
+    Args:
+        paths: Archives, or directories of archives to verify
+        checksums: Known checksums by archive file name; archives not
+            listed fall back to their ``.sha256`` sidecar
+        max_workers: Verification threads (default: ThreadPoolExecutor default)
+    
+    Returns:
+        Results in archive path order
+    """
+    checksums = checksums or {}
+    archives = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            archives.extend(path.glob(SUBMISSION_PATTERN))
+        else:
+            archives.append(path)
+    archives.sort()
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda archive: verify_submission(archive, checksums.get(archive.name)),
+            archives
+        ))
+
+def write_report(results: List[VerificationResult], report_path: Path) -> Path:
+    """Write verification results as CSV or JSON, chosen by file suffix.
+    
+    Returns:
+        Path of the written report
+    """
+    report_path = Path(report_path)
+    rows = [result.to_dict() for result in results]
+    
+    if report_path.suffix.lower() == '.json':
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+    else:
+        with open(report_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            for row in rows:
+                for name in ('missing_files', 'unexpected_files', 'errors'):
+                    row[name] = '; '.join(row[name])
+                writer.writerow(row)
+    return report_path
@@ -35,6 +35,7 @@
     entry_points={
         "console_scripts": [
             "probe-submit=cultural_probes.submission.cli:main",
+            "probe-verify=cultural_probes.submission.cli:verify_main",
         ],
     },
     include_package_data=True,
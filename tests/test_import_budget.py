@@ -0,0 +1,71 @@
+"""Import-time budget for the submission CLI.
+
+Heavy dependencies must only load in the stage that needs them, so that
+``probe-submit --help`` and friends start quickly.
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from typing import List, Set, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Best-of-N wall time allowed for importing each module
+BUDGET_MS = 150
+RUNS = 5
+
+PROBE = '; '.join([
+    'import sys, time',
+    'start = time.perf_counter()',
+    'import {module}',
+    'print((time.perf_counter() - start) * 1000)',
+    'print(*sorted(sys.modules))',
+])
+
+def import_in_subprocess(module: str) -> Tuple[float, Set[str]]:
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        Tuple of (import time in ms, top-level names in sys.modules)
+    """
+    output: List[str] = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.splitlines()
+    return float(output[0]), {name.split('.')[0] for name in output[1].split()}
+
+class TestImportBudget(unittest.TestCase):
+    """Importing the submission entry points stays light."""
+
+    def assert_light(self, module: str, heavy: Set[str]) -> None:
+        """Check a module loads none of ``heavy`` and imports within budget."""
+        runs = [import_in_subprocess(module) for _ in range(RUNS)]
+
+        loaded = heavy & runs[0][1]
+        self.assertFalse(loaded, f"{module} imports heavy modules: {sorted(loaded)}")
+
+        elapsed = min(ms for ms, _ in runs)
+        self.assertLessEqual(
+            elapsed, BUDGET_MS,
+            f"{module} took {elapsed:.1f}ms to import, over the {BUDGET_MS}ms budget"
+        )
+
+    def test_cli(self):
+        self.assert_light(
+            'cultural_probes.submission.cli',
+            {'reportlab', 'markdown', 'pyqrcode', 'yaml', 'zipfile', 'multiprocessing'}
+        )
+
+    def test_submitter(self):
+        self.assert_light(
+            'cultural_probes.submission.submitter',
+            {'reportlab', 'markdown', 'pyqrcode', 'multiprocessing'}
+        )
+
+if __name__ == '__main__':
+    unittest.main()